@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+운세 데이터 샤드 빌더
+별자리별 / 카테고리별로 나눈 작은 JSON 조각을 만들어 앱이 필요한 부분만 받도록 함
+
+- horoscope.csv (2400행) → 별자리 12개 샤드 (horoscope_<sign>.csv는 같은 내용의 사본이라 원본으로 쓰지 않음)
+- src/utils/fortune.csv → 카테고리별 샤드 (Main, Love, Money ...)
+- 샤드 내용: 압축 JSON {"image": 공통 이미지 또는 null, "rows": [[ID, Keyword, Content(, Image_File)]]}
+- 파일명에 내용 해시 포함 (horoscope-aries.1a2b3c4d5e.json), 같은 내용이면 다시 쓰지 않음
+- .gz 사전 압축 항상, .br 은 brotli 모듈이 있을 때만
+- index.json: 별자리/카테고리 → 샤드 파일, 행 수, 크기
+
+사용법:
+    python build_fortune_shards.py                  # → public/fortune_data/shards/
+    python build_fortune_shards.py -o build/shards
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HOROSCOPE_CSV_PATH = os.path.join(BASE_DIR, 'public', 'fortune_data', 'horoscope.csv')
+FORTUNE_CSV_PATH = os.path.join(BASE_DIR, 'src', 'utils', 'fortune.csv')
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'public', 'fortune_data', 'shards')
+INDEX_NAME = 'index.json'
+
+# ID 접두어(H_AR_001) → 별자리
+SIGNS = {
+    'AR': 'aries', 'TA': 'taurus', 'GE': 'gemini', 'CA': 'cancer',
+    'LE': 'leo', 'VI': 'virgo', 'LI': 'libra', 'SC': 'scorpio',
+    'SA': 'sagittarius', 'CP': 'capricorn', 'AQ': 'aquarius', 'PI': 'pisces',
+}
+
+
+def read_csv(path):
+    """세미콜론 CSV → 행 dict 목록 (열 개수가 다른 행은 오류)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        header = f.readline().rstrip('\r\n').split(';')
+        rows = []
+        for line_number, line in enumerate(f, start=2):
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                continue
+            values = line.split(';')
+            if len(values) != len(header):
+                raise ValueError(f"{path}:{line_number}: 열 {len(header)}개가 필요한데 {len(values)}개입니다")
+            rows.append(dict(zip(header, values)))
+    return rows
+
+
+def shard_payload(rows):
+    """행 목록 → 샤드 dict (모든 행의 이미지가 같으면 한 번만 저장)"""
+    images = {row['Image_File'] for row in rows}
+    if len(images) == 1:
+        return {'image': images.pop(), 'rows': [[row['ID'], row['Keyword'], row['Content']] for row in rows]}
+    return {'image': None, 'rows': [[row['ID'], row['Keyword'], row['Content'], row['Image_File']] for row in rows]}
+
+
+def horoscope_shards(path=HOROSCOPE_CSV_PATH):
+    """별자리 → 행 목록"""
+    shards = {}
+    for row in read_csv(path):
+        code = row['ID'].split('_')[1]
+        if code not in SIGNS:
+            raise ValueError(f"{row['ID']}: 알 수 없는 별자리 코드 {code}")
+        shards.setdefault(SIGNS[code], []).append(row)
+    return shards
+
+
+def fortune_shards(path=FORTUNE_CSV_PATH):
+    """카테고리 → 행 목록"""
+    shards = {}
+    for row in read_csv(path):
+        shards.setdefault(row['Category'], []).append(row)
+    return shards
+
+
+def _write_once(path, data):
+    if os.path.exists(path):
+        return
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_shard(output_dir, prefix, key, rows):
+    """샤드 JSON + 압축본 저장 → index 항목"""
+    data = json.dumps(shard_payload(rows), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    name = f"{prefix}-{key.lower()}.{hashlib.sha256(data).hexdigest()[:10]}.json"
+    # mtime=0 → 같은 내용이면 같은 .gz
+    compressed = {'gzip': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed['br'] = brotli.compress(data, quality=11)
+
+    _write_once(os.path.join(output_dir, name), data)
+    entry = {'file': name, 'rows': len(rows), 'bytes': len(data)}
+    for encoding, payload in compressed.items():
+        suffix = '.gz' if encoding == 'gzip' else '.br'
+        _write_once(os.path.join(output_dir, name + suffix), payload)
+        entry[f'{encoding}_bytes'] = len(payload)
+    return entry
+
+
+def build_shards(output_dir=DEFAULT_OUTPUT_DIR, horoscope_path=HOROSCOPE_CSV_PATH, fortune_path=FORTUNE_CSV_PATH):
+    """모든 샤드와 index.json 생성. index dict 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    index = {
+        'encodings': ['gzip'] + (['br'] if brotli is not None else []),
+        'horoscope': {sign: write_shard(output_dir, 'horoscope', sign, rows)
+                      for sign, rows in sorted(horoscope_shards(horoscope_path).items())},
+        'fortune': {category: write_shard(output_dir, 'fortune', category, rows)
+                    for category, rows in sorted(fortune_shards(fortune_path).items())},
+    }
+
+    tmp_path = os.path.join(output_dir, INDEX_NAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(output_dir, INDEX_NAME))
+
+    # 예전 해시 이름의 샤드 정리
+    referenced = {entry['file'] for group in ('horoscope', 'fortune') for entry in index[group].values()}
+    for path in glob.glob(os.path.join(output_dir, '*.*.json*')):
+        name = os.path.basename(path)
+        if name.split('.json')[0] + '.json' not in referenced:
+            os.remove(path)
+
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='운세 CSV를 별자리/카테고리별 샤드로 나누기')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='출력 폴더')
+    parser.add_argument('--horoscope', default=HOROSCOPE_CSV_PATH, help='horoscope.csv 경로')
+    parser.add_argument('--fortune', default=FORTUNE_CSV_PATH, help='fortune.csv 경로')
+    args = parser.parse_args()
+
+    index = build_shards(args.output, args.horoscope, args.fortune)
+
+    if brotli is None:
+        print("ℹ️ brotli 모듈이 없어 .br 파일은 만들지 않았습니다 (pip install brotli)")
+    for group, source in (('horoscope', args.horoscope), ('fortune', args.fortune)):
+        entries = index[group].values()
+        total = sum(entry['bytes'] for entry in entries)
+        gzipped = sum(entry['gzip_bytes'] for entry in entries)
+        largest = max(entries, key=lambda entry: entry['gzip_bytes'])
+        print(f"{group}: {len(index[group])}개 샤드, 원본 {os.path.getsize(source) / 1024:.0f} KB → "
+              f"JSON {total / 1024:.0f} KB / gzip {gzipped / 1024:.0f} KB "
+              f"(샤드 하나 최대 gzip {largest['gzip_bytes'] / 1024:.1f} KB)")
+    print(f"✅ {os.path.join(args.output, INDEX_NAME)}")
+
+
+if __name__ == '__main__':
+    main()
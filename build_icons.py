@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+ShareNote 아이콘 통합 빌드 스크립트
+- 디자인 레지스트리 (app, fresh, modern, v2, v3, v4 + SDF 버전 fresh-sdf, v3-sdf)
+- 디자인 × 밀도 × 변형(square, round, squircle, legacy, foreground) 작업을 프로세스 풀로 병렬 렌더링
+  (round / squircle / legacy는 정사각형 렌더 한 장에서 캐시된 마스크로 파생)
+- 출력 루트 지정 가능 (기본: build/icons/<디자인>/<밀도>/)
+- 증분 빌드: 디자인 파라미터 + 렌더러 버전 해시를 매니페스트에 기록하고
+  해시가 같으면 렌더링을 건너뛰며, 인코딩 결과가 같으면 파일을 다시 쓰지 않음
+- 출력 PNG는 icon_encode로 최적 인코딩 (무손실 팔레트 축소, 메타데이터 제거)
+- 여러 목적지(--mirror)에는 한 번 인코딩한 바이트를 하드링크/복제로 기록
+- --vector: SDF 디자인을 VectorDrawable + adaptive-icon XML로 출력 (icon_vector)
+  PNG는 API 26 미만용 ic_launcher / ic_launcher_round만 렌더링
+
+사용 예:
+    python build_icons.py                         # 모든 디자인 후보 렌더링
+    python build_icons.py fresh v3 -j 8           # 일부 디자인만
+    python build_icons.py v3 --android            # 안드로이드 res 폴더에 바로 설치
+    python build_icons.py --force                 # 매니페스트 무시하고 전부 다시 렌더링
+    python build_icons.py v3-sdf --android --vector  # 벡터 adaptive icon + 레거시 PNG만 설치
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import PIL
+
+import generate_app_icon
+import generate_fresh_icon
+import generate_modern_icon
+import generate_sharenote_icon
+import generate_sharenote_icon_v3
+import generate_sharenote_icon_v4
+import icon_compose
+import icon_encode
+import icon_fonts
+import icon_sdf
+import icon_vector
+from icon_encode import write_destinations, write_if_changed
+
+ICON_SIZES = {
+    'mipmap-mdpi': 48,
+    'mipmap-hdpi': 72,
+    'mipmap-xhdpi': 96,
+    'mipmap-xxhdpi': 144,
+    'mipmap-xxxhdpi': 192,
+}
+
+# 변형별 출력 파일명
+VARIANT_FILES = {
+    'square': 'ic_launcher.png',
+    'round': 'ic_launcher_round.png',
+    'squircle': 'ic_launcher_squircle.png',
+    'legacy': 'ic_launcher_legacy.png',
+    'foreground': 'ic_launcher_foreground.png',
+}
+
+# 안드로이드 res 폴더에 설치할 때 쓰는 변형 (squircle / legacy는 검토용)
+ANDROID_VARIANTS = ['square', 'round', 'foreground']
+
+# --vector일 때: foreground는 벡터 XML이 대신하므로 레거시 PNG만
+ANDROID_VECTOR_VARIANTS = ['square', 'round']
+
+# 디자인 레지스트리
+# - square: 정사각형 아이콘 렌더러 (필수)
+# - foreground: Adaptive Icon foreground 렌더러 (없으면 생략)
+# - depends: 렌더러가 쓰는 추가 모듈 (소스가 바뀌면 증분 빌드 무효화)
+# - adaptive: (배경 채우기, foreground SDF 레이어)를 돌려주는 함수 (--vector 지원 디자인만)
+# round / squircle / legacy 변형은 square 렌더 결과에서 마스크로 만든다
+DESIGNS = {
+    'app': {
+        'square': generate_app_icon.create_sharenote_icon,
+        'foreground': generate_app_icon.create_foreground_icon,
+    },
+    'fresh': {
+        'square': generate_fresh_icon.create_fresh_icon,
+        'foreground': generate_fresh_icon.create_foreground_icon,
+    },
+    'modern': {
+        'square': generate_modern_icon.create_modern_icon,
+        'foreground': generate_modern_icon.create_foreground_icon,
+    },
+    'v2': {
+        'square': generate_sharenote_icon.create_sharenote_icon_v2,
+        'foreground': generate_sharenote_icon.create_foreground_icon,
+    },
+    'v3': {
+        'square': generate_sharenote_icon_v3.create_sharenote_icon_v3,
+        'foreground': generate_sharenote_icon_v3.create_foreground_icon,
+    },
+    # SDF 도형으로 기술한 버전 (슈퍼샘플링 없이 목표 크기에 직접 래스터화)
+    'fresh-sdf': {
+        'square': generate_fresh_icon.create_fresh_icon_sdf,
+        'foreground': generate_fresh_icon.create_foreground_icon_sdf,
+        'adaptive': generate_fresh_icon.fresh_adaptive_layers,
+        'depends': [icon_sdf],
+    },
+    'v3-sdf': {
+        'square': generate_sharenote_icon_v3.create_sharenote_icon_v3_sdf,
+        'foreground': generate_sharenote_icon_v3.create_foreground_icon_sdf,
+        'adaptive': generate_sharenote_icon_v3.v3_adaptive_layers,
+        'depends': [icon_sdf],
+    },
+    'v4': {
+        'square': generate_sharenote_icon_v4.create_sharenote_icon_v4,
+        'depends': [icon_fonts],
+    },
+}
+
+DEFAULT_OUTPUT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build', 'icons')
+ANDROID_RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'android', 'app', 'src', 'main', 'res')
+# res 폴더를 더럽히지 않도록 안드로이드 설치용 매니페스트는 build/ 아래에 둔다
+ANDROID_MANIFEST_PATH = os.path.join(DEFAULT_OUTPUT_ROOT, 'android-manifest.json')
+MANIFEST_NAME = 'icon-manifest.json'
+
+# 렌더링/인코딩 방식이 바뀌면 올려서 모든 출력을 무효화
+RENDERER_VERSION = 3
+
+_source_hash_cache = {}
+
+
+def design_variants(design):
+    """디자인이 지원하는 변형 목록"""
+    variants = ['square'] + list(icon_compose.DERIVED_VARIANTS)
+    if 'foreground' in DESIGNS[design]:
+        variants.append('foreground')
+    return variants
+
+
+def variant_source(variant):
+    """변형을 만들 원본 렌더 ('square' 또는 'foreground')"""
+    return 'foreground' if variant == 'foreground' else 'square'
+
+
+def render_variants(design, size, source, variants):
+    """원본 렌더 한 장으로 여러 변형 생성 → {variant: Image}"""
+    img = DESIGNS[design][source](size)
+    if source == 'foreground':
+        return {'foreground': img}
+    return icon_compose.derive_variants(img, variants)
+
+
+def _source_hash(module):
+    """
+    렌더러 모듈 소스 코드 해시
+    디자인 파라미터가 소스에 하드코딩되어 있고 렌더러가 같은 모듈의 헬퍼(장면 정의 등)를
+    부르므로 함수 단위가 아니라 모듈 전체를 해시한다
+    """
+    if module not in _source_hash_cache:
+        source = inspect.getsource(module)
+        _source_hash_cache[module] = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    return _source_hash_cache[module]
+
+
+def job_key(output):
+    """출력 하나 (design, folder, size, variant)를 결정하는 입력 전체의 해시"""
+    design, _, size, variant = output
+    entry = DESIGNS[design]
+
+    modules = [inspect.getmodule(entry[variant_source(variant)])]
+    if variant in icon_compose.DERIVED_VARIANTS:
+        modules.append(icon_compose)
+    modules += entry.get('depends', [])
+    modules.append(icon_encode)
+
+    payload = {
+        'renderer': RENDERER_VERSION,
+        'pillow': PIL.__version__,
+        'design': design,
+        'size': size,
+        'variant': variant,
+        'sources': [_source_hash(module) for module in modules],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_manifest(path):
+    """매니페스트 로드 (없거나 깨졌으면 빈 매니페스트)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'renderer': RENDERER_VERSION, 'outputs': {}}
+
+    if manifest.get('renderer') != RENDERER_VERSION:
+        return {'renderer': RENDERER_VERSION, 'outputs': {}}
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def render_job(job):
+    """프로세스 풀 작업: (design, size, source, variants) → [(variant, PNG 바이트)]"""
+    design, size, source, variants = job
+    results = []
+
+    for variant, img in render_variants(design, size, source, variants).items():
+        data, _ = icon_encode.encode_png(img)
+        results.append((variant, data))
+
+    return results
+
+
+def plan_outputs(designs, densities=None, variants=None):
+    """디자인 × 밀도 × 변형 출력 목록 생성"""
+    outputs = []
+    for design in designs:
+        for folder, size in ICON_SIZES.items():
+            if densities and folder not in densities:
+                continue
+            for variant in design_variants(design):
+                if variants and variant not in variants:
+                    continue
+                outputs.append((design, folder, size, variant))
+    return outputs
+
+
+def output_path(output_root, output, per_design=True):
+    """출력이 저장될 경로"""
+    design, folder, _, variant = output
+    parts = [output_root]
+    if per_design:
+        parts.append(design)
+    parts += [folder, VARIANT_FILES[variant]]
+    return os.path.join(*parts)
+
+
+def build_icons(designs, output_root=DEFAULT_OUTPUT_ROOT, densities=None, variants=None,
+                per_design=True, workers=None, manifest_path=None, force=False, mirrors=()):
+    """
+    작업을 프로세스 풀로 분산 렌더링하고 출력 루트에 저장
+    mirrors의 각 루트에도 같은 레이아웃으로 같은 바이트를 기록 (한 번 인코딩, 가능하면 하드링크)
+    매니페스트의 해시와 같은 출력은 건너뛴다. 결과 통계 dict 반환
+    """
+    if manifest_path is None:
+        manifest_path = os.path.join(output_root, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    outputs = manifest['outputs']
+
+    stats = {'rendered': 0, 'written': 0, 'unchanged': 0, 'skipped': 0}
+    # (design, folder, size, source) → 다시 만들어야 하는 출력 목록
+    pending = {}
+
+    for output in plan_outputs(designs, densities, variants):
+        path = output_path(output_root, output, per_design)
+        destinations = [path] + [output_path(mirror, output, per_design) for mirror in mirrors]
+        rel_path = os.path.relpath(path, output_root).replace(os.sep, '/')
+        key = job_key(output)
+
+        entry = outputs.get(rel_path)
+        if (not force and entry and entry.get('key') == key
+                and all(os.path.exists(dest) for dest in destinations)):
+            stats['skipped'] += 1
+            continue
+
+        design, folder, size, variant = output
+        group = (design, folder, size, variant_source(variant))
+        pending.setdefault(group, {})[variant] = (destinations, rel_path, key)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(render_job, (design, size, source, list(targets))): (design, folder, size, targets)
+                for (design, folder, size, source), targets in pending.items()
+            }
+            for future in as_completed(futures):
+                design, folder, size, targets = futures[future]
+                stats['rendered'] += 1
+
+                for variant, data in future.result():
+                    destinations, rel_path, key = targets[variant]
+                    results = write_destinations(data, destinations)
+                    if all(method == 'unchanged' for method in results.values()):
+                        stats['unchanged'] += 1
+                        print(f'Unchanged {design}/{folder}/{VARIANT_FILES[variant]}')
+                    else:
+                        stats['written'] += 1
+                        print(f'Created {design}/{folder}/{VARIANT_FILES[variant]} ({size}x{size})'
+                              + (f' + {len(destinations) - 1} mirror(s)' if mirrors else ''))
+
+                    outputs[rel_path] = {
+                        'key': key,
+                        'sha256': hashlib.sha256(data).hexdigest(),
+                        'bytes': len(data),
+                    }
+
+        save_manifest(manifest_path, manifest)
+
+    return stats
+
+
+def build_vector_icons(design, res_root, remove_raster_foreground=False):
+    """
+    adaptive icon을 벡터 XML로 res_root에 기록 (내용이 같으면 쓰지 않음)
+    remove_raster_foreground: 더 이상 참조되지 않는 mipmap-*/ic_launcher_foreground.png 삭제
+    """
+    background_fill, foreground_layers = DESIGNS[design]['adaptive']()
+    files = icon_vector.adaptive_icon_files(background_fill, foreground_layers)
+
+    for rel_path, xml in files.items():
+        written = write_if_changed(os.path.join(res_root, rel_path), xml.encode('utf-8'))
+        print(f"{'Created' if written else 'Unchanged'} {rel_path.replace(os.sep, '/')}")
+
+    if remove_raster_foreground:
+        for folder in ICON_SIZES:
+            path = os.path.join(res_root, folder, VARIANT_FILES['foreground'])
+            if os.path.exists(path):
+                os.remove(path)
+                print(f'Removed {folder}/{VARIANT_FILES["foreground"]} (replaced by vector)')
+
+    return len(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ShareNote 아이콘 통합 빌드')
+    parser.add_argument('designs', nargs='*', metavar='design',
+                        help=f'렌더링할 디자인 (기본: 전체) - {", ".join(DESIGNS)}')
+    parser.add_argument('-o', '--output-root', default=DEFAULT_OUTPUT_ROOT,
+                        help='출력 루트 디렉토리')
+    parser.add_argument('--android', action='store_true',
+                        help='디자인 하나를 android res 폴더에 바로 설치')
+    parser.add_argument('--mirror', action='append', default=[],
+                        help='같은 출력을 추가로 기록할 루트 (반복 지정 가능, 가능하면 하드링크)')
+    parser.add_argument('--density', action='append', choices=list(ICON_SIZES),
+                        help='특정 밀도만 렌더링 (반복 지정 가능)')
+    parser.add_argument('--variant', action='append', choices=list(VARIANT_FILES),
+                        help='특정 변형만 렌더링 (반복 지정 가능)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--manifest', default=None,
+                        help='증분 빌드 매니페스트 경로 (기본: <출력 루트>/icon-manifest.json)')
+    parser.add_argument('--force', action='store_true',
+                        help='매니페스트를 무시하고 모든 출력을 다시 렌더링')
+    parser.add_argument('--vector', action='store_true',
+                        help='adaptive icon을 VectorDrawable XML로 출력 (SDF 디자인만)')
+    args = parser.parse_args()
+
+    designs = args.designs or list(DESIGNS)
+    unknown = [d for d in designs if d not in DESIGNS]
+    if unknown:
+        parser.error(f'알 수 없는 디자인: {", ".join(unknown)}')
+    if args.vector:
+        designs = args.designs or [d for d in DESIGNS if 'adaptive' in DESIGNS[d]]
+        no_vector = [d for d in designs if 'adaptive' not in DESIGNS[d]]
+        if no_vector:
+            parser.error(f'--vector 를 지원하지 않는 디자인: {", ".join(no_vector)}')
+    output_root = args.output_root
+    manifest_path = args.manifest
+    per_design = True
+
+    if args.android:
+        if len(designs) != 1:
+            parser.error('--android 는 디자인을 하나만 지정해야 합니다')
+        output_root = ANDROID_RES_DIR
+        manifest_path = manifest_path or ANDROID_MANIFEST_PATH
+        per_design = False
+        args.variant = args.variant or (ANDROID_VECTOR_VARIANTS if args.vector else ANDROID_VARIANTS)
+    elif args.vector:
+        args.variant = args.variant or ANDROID_VECTOR_VARIANTS
+
+    if args.vector:
+        for design in designs:
+            res_root = output_root if not per_design else os.path.join(output_root, design)
+            build_vector_icons(design, res_root, remove_raster_foreground=args.android)
+
+    print(f'Icon build started: {", ".join(designs)}')
+    stats = build_icons(designs, output_root, args.density, args.variant,
+                        per_design, args.jobs, manifest_path, args.force, args.mirror)
+    print(f'\nIcon build completed! → {output_root}')
+    print(f"rendered {stats['rendered']}, written {stats['written']}, "
+          f"unchanged {stats['unchanged']}, skipped {stats['skipped']}")
+
+
+if __name__ == '__main__':
+    main()
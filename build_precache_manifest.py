@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Service-Worker Precache Manifest Builder
+Lists the fortune data and tarot assets the web client should cache, with content hashes
+
+- Walks public/fortune_data and public/images/tarot (responsive/, atlas/ and placeholders included)
+- Every entry: {url, revision, size}; revision = first 16 hex chars of SHA-256,
+  or null for files whose name is already content-hashed (process_tarot_images / build_tarot_atlas output)
+- Grouped by priority:
+    critical    fortune CSV / JSON, the fortune shard index, tarot indexes
+                (placeholders.json, atlas.json, responsive manifest)
+    thumbnails  atlas sheets and the smallest responsive variant of each card (WebP)
+    lazy        everything else (fortune shards, full-size cards, larger variants, JPEG fallbacks)
+- A top-level revision (hash of all entries) lets the client skip the diff when nothing changed
+- Output goes to public/, so Vite copies it into dist/ for Firebase Hosting
+
+Usage:
+    python build_precache_manifest.py                     # → public/precache-manifest.json
+    python build_precache_manifest.py --public dist -o dist/precache-manifest.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PUBLIC_DIR = os.path.join(BASE_DIR, 'public')
+MANIFEST_NAME = 'precache-manifest.json'
+SCAN_DIRS = ['fortune_data', 'images/tarot']
+PRIORITIES = ['critical', 'thumbnails', 'lazy']
+
+# build_fortune_shards 출력: index.json만 먼저 받고 샤드는 필요할 때
+SHARD_DIR = 'fortune_data/shards/'
+CRITICAL_FILES = {
+    SHARD_DIR + 'index.json',
+    'images/tarot/placeholders.json',
+    'images/tarot/atlas/atlas.json',
+    'images/tarot/responsive/manifest.json',
+}
+# major_00.320.1a2b3c4d5e.webp / tarot-atlas-0.1a2b3c4d5e.webp / horoscope-aries.1a2b3c4d5e.json.gz
+HASHED_NAME = re.compile(r'\.[0-9a-f]{10}(\.[a-z]+)+$')
+RESPONSIVE_NAME = re.compile(r'^images/tarot/responsive/(?P<stem>[^/.]+)\.(?P<width>\d+)\.[0-9a-f]{10}\.webp$')
+
+
+def file_revision(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def scan(public_dir):
+    """Relative URL paths (forward slashes) of every asset under SCAN_DIRS"""
+    paths = []
+    for scan_dir in SCAN_DIRS:
+        root = os.path.join(public_dir, scan_dir)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+            for filename in sorted(filenames):
+                if filename.startswith('.') or filename.endswith('.tmp'):
+                    continue
+                paths.append(os.path.relpath(os.path.join(dirpath, filename), public_dir).replace(os.sep, '/'))
+    return paths
+
+
+def classify(paths):
+    """path → priority group"""
+    # 카드별 가장 작은 반응형 WebP만 썸네일로 취급
+    smallest = {}
+    for path in paths:
+        match = RESPONSIVE_NAME.match(path)
+        if match:
+            stem, width = match['stem'], int(match['width'])
+            if stem not in smallest or width < smallest[stem][0]:
+                smallest[stem] = (width, path)
+    thumbnails = {path for _, path in smallest.values()}
+
+    groups = {}
+    for path in paths:
+        if path in CRITICAL_FILES or (path.startswith('fortune_data/') and not path.startswith(SHARD_DIR)):
+            groups[path] = 'critical'
+        elif path in thumbnails or (path.startswith('images/tarot/atlas/') and path.endswith('.webp')):
+            groups[path] = 'thumbnails'
+        else:
+            groups[path] = 'lazy'
+    return groups
+
+
+def build_manifest(public_dir=DEFAULT_PUBLIC_DIR):
+    """Scan, hash and group the assets. Returns the manifest dict"""
+    paths = scan(public_dir)
+    groups = classify(paths)
+
+    manifest = {'revision': None, 'groups': {priority: [] for priority in PRIORITIES}}
+    for path in paths:
+        full_path = os.path.join(public_dir, path)
+        name = os.path.basename(path)
+        manifest['groups'][groups[path]].append({
+            'url': '/' + path,
+            'revision': None if HASHED_NAME.search(name) else file_revision(full_path),
+            'size': os.path.getsize(full_path),
+        })
+
+    # 이름에 해시가 있는 항목은 URL 자체가 리비전
+    summary = json.dumps(manifest['groups'], sort_keys=True, separators=(',', ':')).encode('utf-8')
+    manifest['revision'] = hashlib.sha256(summary).hexdigest()[:16]
+    return manifest
+
+
+def write_manifest(manifest, output_path):
+    """Write the manifest if it changed. Returns True if the file was written"""
+    data = json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8')
+    try:
+        with open(output_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a prioritized service-worker precache manifest')
+    parser.add_argument('--public', default=DEFAULT_PUBLIC_DIR, help='Static root that is deployed (public/ or dist/)')
+    parser.add_argument('-o', '--output', default=None, help=f'Manifest path (default: <public>/{MANIFEST_NAME})')
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.join(args.public, MANIFEST_NAME)
+    manifest = build_manifest(args.public)
+    changed = write_manifest(manifest, output_path)
+
+    for priority in PRIORITIES:
+        entries = manifest['groups'][priority]
+        total = sum(entry['size'] for entry in entries)
+        print(f"   {priority:<10} {len(entries):4d} files {total / 1024:10.1f} KB")
+    print(f"{'Wrote' if changed else 'Unchanged'} {output_path} (revision {manifest['revision']})")
+
+
+if __name__ == '__main__':
+    main()
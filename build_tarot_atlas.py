@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tarot Sprite Atlas Builder
+Packs thumbnails of all 78 cards into one (or a few) sprite sheets for one-request deck loading
+
+- Thumbnails use the same uniform aspect ratio as process_tarot_images
+- Skyline bottom-left bin packing into sheets of at most --max-size pixels
+  (mixed thumbnail sizes pack too; a new sheet starts when a card no longer fits)
+- Sheets are written as WebP + JPEG with content-hashed names
+- atlas.json maps every image file (major_00.jpg ...) to {sheet, x, y, w, h}
+  and every Tarot.csv row ID (T001 ...) to its image file
+
+Usage:
+    python build_tarot_atlas.py                       # 120px thumbnails → public/images/tarot/atlas/
+    python build_tarot_atlas.py --width 96 --max-size 1024
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from process_tarot_images import PUBLIC_TAROT_DIR, deck_aspect, default_source_dir
+from update_tarot_csv import TAROT_MAPPING
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(PUBLIC_TAROT_DIR, 'atlas')
+TAROT_CSV_PATH = os.path.join(BASE_DIR, 'public', 'fortune_data', 'Tarot.csv')
+INDEX_NAME = 'atlas.json'
+
+DEFAULT_THUMB_WIDTH = 120
+DEFAULT_MAX_SIZE = 2048
+# 인접 카드 색이 번지지 않도록 카드 사이 여백
+PADDING = 2
+JPEG_QUALITY = 85
+WEBP_QUALITY = 82
+
+
+class SkylinePacker:
+    """
+    Skyline bottom-left bin packer for one sheet of `width` x `height`.
+    The skyline is a list of (x, y, width) segments: the top edge of everything placed so far
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.skyline = [(0, 0, width)]
+
+    def _fit(self, index, w, h):
+        """Lowest y at which a w x h rect fits starting at segment `index` (None if it doesn't)"""
+        x, y, _ = self.skyline[index]
+        if x + w > self.width:
+            return None
+        remaining = w
+        i = index
+        while remaining > 0:
+            if i >= len(self.skyline):
+                return None
+            y = max(y, self.skyline[i][1])
+            if y + h > self.height:
+                return None
+            remaining -= self.skyline[i][2]
+            i += 1
+        return y
+
+    def insert(self, w, h):
+        """Place a w x h rect. Returns (x, y) or None if the sheet is full"""
+        best = None
+        for i, (x, _, seg_w) in enumerate(self.skyline):
+            y = self._fit(i, w, h)
+            # 가장 낮은 위치, 같으면 남는 폭이 작은 쪽
+            if y is not None and (best is None or (y + h, seg_w) < (best[1] + h, best[3])):
+                best = (x, y, i, seg_w)
+        if best is None:
+            return None
+
+        x, y, index, _ = best
+        self._add_segment(index, x, y + h, w)
+        return x, y
+
+    def _add_segment(self, index, x, y, w):
+        self.skyline.insert(index, (x, y, w))
+        # 새 세그먼트에 가려진 오른쪽 세그먼트를 잘라냄
+        i = index + 1
+        while i < len(self.skyline):
+            sx, sy, sw = self.skyline[i]
+            prev_x, _, prev_w = self.skyline[i - 1]
+            overlap = prev_x + prev_w - sx
+            if overlap <= 0:
+                break
+            if sw <= overlap:
+                del self.skyline[i]
+            else:
+                self.skyline[i] = (sx + overlap, sy, sw - overlap)
+                break
+        # 같은 높이의 이웃 세그먼트 병합
+        i = 0
+        while i < len(self.skyline) - 1:
+            x0, y0, w0 = self.skyline[i]
+            _, y1, w1 = self.skyline[i + 1]
+            if y0 == y1:
+                self.skyline[i] = (x0, y0, w0 + w1)
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+    def used_size(self, placed):
+        """Bounding box of the rects placed on this sheet (to crop unused space)"""
+        return (max(x + w for x, y, w, h in placed), max(y + h for x, y, w, h in placed))
+
+
+def pack(sizes, max_size=DEFAULT_MAX_SIZE, padding=PADDING):
+    """
+    Pack {name: (w, h)} into as few sheets as needed.
+    Returns [(sheet_width, sheet_height, {name: (x, y, w, h)})]
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    sheets = []
+    packers = []
+
+    for name in order:
+        w, h = sizes[name]
+        if w + padding > max_size or h + padding > max_size:
+            raise ValueError(f'{name} ({w}x{h}) does not fit in a {max_size}px sheet')
+        for packer, placed in zip(packers, sheets):
+            position = packer.insert(w + padding, h + padding)
+            if position:
+                placed[name] = (*position, w, h)
+                break
+        else:
+            packer = SkylinePacker(max_size, max_size)
+            packers.append(packer)
+            x, y = packer.insert(w + padding, h + padding)
+            sheets.append({name: (x, y, w, h)})
+
+    return [(*packer.used_size(list(placed.values())), placed) for packer, placed in zip(packers, sheets)]
+
+
+def make_thumbnail(args):
+    """Process-pool job: (path, width, height) → (name, RGB bytes)"""
+    path, width, height = args
+    with Image.open(path) as img:
+        img.draft('RGB', (width, height))
+        thumb = ImageOps.fit(img.convert('RGB'), (width, height), Image.Resampling.LANCZOS)
+    return os.path.basename(path), thumb.tobytes()
+
+
+def csv_rows(csv_path=TAROT_CSV_PATH):
+    """Tarot.csv ID → Image_File"""
+    rows = {}
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            parts = line.rstrip('\n').split(';')
+            if i == 0 or len(parts) != 5:
+                continue
+            rows[parts[1]] = parts[4]
+    return rows
+
+
+def _encode(img, fmt):
+    buffer = io.BytesIO()
+    if fmt == 'webp':
+        img.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=5)
+    else:
+        img.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def build_atlas(source_dir=None, output_dir=DEFAULT_OUTPUT_DIR, thumb_width=DEFAULT_THUMB_WIDTH,
+                max_size=DEFAULT_MAX_SIZE, workers=None):
+    """Build the sheets and the index. Returns the index dict"""
+    source_dir = source_dir or default_source_dir()
+    names = sorted(set(TAROT_MAPPING.values()))
+    paths = [os.path.join(source_dir, name) for name in names]
+    missing = [name for name, path in zip(names, paths) if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"{len(missing)} card image(s) missing in {source_dir}: {', '.join(missing[:5])}")
+
+    aspect = deck_aspect(paths)
+    thumb_height = round(thumb_width / aspect)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        thumbs = dict(pool.map(make_thumbnail, [(path, thumb_width, thumb_height) for path in paths]))
+
+    layout = pack({name: (thumb_width, thumb_height) for name in names}, max_size)
+    os.makedirs(output_dir, exist_ok=True)
+
+    index = {'thumb': {'width': thumb_width, 'height': thumb_height}, 'sheets': [], 'cards': {}}
+    written = set()
+    for sheet_index, (width, height, placed) in enumerate(layout):
+        sheet = Image.new('RGB', (width, height), (0, 0, 0))
+        for name, (x, y, w, h) in placed.items():
+            sheet.paste(Image.frombytes('RGB', (w, h), thumbs[name]), (x, y))
+            index['cards'][name] = {'sheet': sheet_index, 'x': x, 'y': y, 'w': w, 'h': h}
+
+        entry = {'width': width, 'height': height}
+        for fmt, ext in (('webp', 'webp'), ('jpeg', 'jpg')):
+            data = _encode(sheet, fmt)
+            filename = f"tarot-atlas-{sheet_index}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+            with open(os.path.join(output_dir, filename), 'wb') as f:
+                f.write(data)
+            entry[fmt] = filename
+            entry[f'{fmt}_bytes'] = len(data)
+            written.add(filename)
+        index['sheets'].append(entry)
+
+    index['cards'] = dict(sorted(index['cards'].items()))
+    index['rows'] = {row_id: image for row_id, image in csv_rows().items() if image in index['cards']}
+
+    with open(os.path.join(output_dir, INDEX_NAME), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+
+    # 예전 해시 이름의 시트 정리
+    for path in glob.glob(os.path.join(output_dir, 'tarot-atlas-*')):
+        if os.path.basename(path) not in written:
+            os.remove(path)
+
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack tarot card thumbnails into sprite sheets')
+    parser.add_argument('--source', default=None,
+                        help='Directory with the raw card JPEGs (default: public/images/tarot or the archive)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--width', type=int, default=DEFAULT_THUMB_WIDTH, help='Thumbnail width in pixels')
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE, help='Maximum sheet width/height')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    index = build_atlas(args.source, args.output, args.width, args.max_size, args.jobs)
+
+    print(f"Packed {len(index['cards'])} cards ({index['thumb']['width']}x{index['thumb']['height']}) "
+          f"into {len(index['sheets'])} sheet(s):")
+    for sheet in index['sheets']:
+        print(f"   {sheet['webp']} {sheet['width']}x{sheet['height']} "
+              f"({sheet['webp_bytes'] // 1024}K WebP / {sheet['jpeg_bytes'] // 1024}K JPEG)")
+    print(f"{len(index['rows'])} Tarot.csv rows resolved → {os.path.join(args.output, INDEX_NAME)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tarot Card Placeholder Builder
+Precomputes what the app paints while a tarot image is still loading
+
+- BlurHash string (4x3 components by default), encoded with NumPy matrix products
+- A 16px-wide inline WebP data URI
+- Dominant color (most populated 4-bit-per-channel color bin) and average color
+- One JSON index keyed by the Image_File value used in Tarot.csv (major_00.jpg ...)
+- Cards are processed in parallel by a process pool
+
+Usage:
+    python build_tarot_placeholders.py                  # → public/images/tarot/placeholders.json
+    python build_tarot_placeholders.py --components 5 4 -o build/placeholders.json
+"""
+
+import argparse
+import base64
+import glob
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from process_tarot_images import PUBLIC_TAROT_DIR, default_source_dir
+
+DEFAULT_OUTPUT_PATH = os.path.join(PUBLIC_TAROT_DIR, 'placeholders.json')
+
+# BlurHash 계산용 축소 이미지 너비 (결과에는 거의 영향 없음, 속도만 좌우)
+SAMPLE_WIDTH = 32
+DEFAULT_COMPONENTS = (4, 3)
+INLINE_WIDTH = 16
+INLINE_QUALITY = 40
+
+BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def _base83(value, length):
+    return ''.join(BASE83[(value // 83 ** (length - 1 - i)) % 83] for i in range(length))
+
+
+def _srgb_to_linear(values):
+    """0~255 sRGB → 0~1 linear"""
+    v = values / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(value):
+    v = min(max(value, 0.0), 1.0)
+    return round((v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055) * 255)
+
+
+def blurhash(pixels, components_x=4, components_y=3):
+    """
+    BlurHash of an (H, W, 3) uint8 array.
+    All cosine factors are computed at once: factors[j, i] = Σ cos_y[j, y] · cos_x[i, x] · rgb[y, x]
+    """
+    height, width = pixels.shape[:2]
+    linear = _srgb_to_linear(pixels.astype(np.float64))
+
+    cos_x = np.cos(np.pi * np.arange(components_x)[:, None] * np.arange(width)[None, :] / width)
+    cos_y = np.cos(np.pi * np.arange(components_y)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum('jy,ix,yxc->jic', cos_y, cos_x, linear) / (width * height)
+    # DC 이외 성분은 정규화 계수 2
+    factors[1:, :] *= 2
+    factors[0, 1:] *= 2
+
+    dc = factors[0, 0]
+    ac = factors.reshape(-1, 3)[1:]
+
+    size_flag = (components_x - 1) + (components_y - 1) * 9
+    result = _base83(size_flag, 1)
+
+    if len(ac):
+        actual_max = float(np.abs(ac).max())
+        quantised_max = int(max(0, min(82, np.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        max_value = 1
+        result += _base83(0, 1)
+
+    r, g, b = (_linear_to_srgb(c) for c in dc)
+    result += _base83((r << 16) + (g << 8) + b, 4)
+
+    # AC 성분: 부호 있는 제곱근 압축 후 19단계 양자화
+    quant = np.clip(np.floor(np.sign(ac) * np.abs(ac / max_value) ** 0.5 * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quant:
+        result += _base83(qr * 19 * 19 + qg * 19 + qb, 2)
+    return result
+
+
+def dominant_color(pixels):
+    """Most populated 4-bit-per-channel bin, averaged over the pixels that fall into it"""
+    flat = pixels.reshape(-1, 3).astype(np.int64)
+    bins = (flat[:, 0] >> 4) << 8 | (flat[:, 1] >> 4) << 4 | (flat[:, 2] >> 4)
+    counts = np.bincount(bins, minlength=4096)
+    members = flat[bins == counts.argmax()]
+    return tuple(int(round(c)) for c in members.mean(axis=0))
+
+
+def _hex(color):
+    return '#{:02x}{:02x}{:02x}'.format(*color)
+
+
+def inline_data_uri(img):
+    """16px-wide WebP as a data: URI"""
+    height = max(1, round(img.height * INLINE_WIDTH / img.width))
+    small = img.resize((INLINE_WIDTH, height), Image.Resampling.BOX)
+    buffer = io.BytesIO()
+    small.save(buffer, 'WEBP', quality=INLINE_QUALITY)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def card_placeholder(args):
+    """Process-pool job: (path, components) → (Image_File, placeholder entry)"""
+    path, components = args
+    with Image.open(path) as img:
+        width, height = img.size
+        # DCT 스케일링으로 작게 디코딩한 뒤 축소
+        img.draft('RGB', (SAMPLE_WIDTH * 2, SAMPLE_WIDTH * 2 * height // width))
+        img = img.convert('RGB')
+        sample = img.resize((SAMPLE_WIDTH, max(1, round(SAMPLE_WIDTH * height / width))), Image.Resampling.BOX)
+
+    pixels = np.asarray(sample)
+    return os.path.basename(path), {
+        'width': width,
+        'height': height,
+        'blurhash': blurhash(pixels, *components),
+        'dominant': _hex(dominant_color(pixels)),
+        'average': _hex(tuple(int(round(c)) for c in pixels.reshape(-1, 3).mean(axis=0))),
+        'dataUri': inline_data_uri(img),
+    }
+
+
+def build_placeholders(source_dir=None, output_path=DEFAULT_OUTPUT_PATH,
+                       components=DEFAULT_COMPONENTS, workers=None):
+    """Compute placeholders for every card and write the JSON index. Returns the index"""
+    source_dir = source_dir or default_source_dir()
+    paths = sorted(glob.glob(os.path.join(source_dir, '*.jpg')))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        index = dict(pool.map(card_placeholder, [(path, tuple(components)) for path in paths]))
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(index.items())), f, indent=1)
+    os.replace(tmp_path, output_path)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute blur placeholders and dominant colors for tarot cards')
+    parser.add_argument('--source', default=None,
+                        help='Directory with the card JPEGs (default: public/images/tarot or the archive)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_PATH, help='JSON index path')
+    parser.add_argument('--components', type=int, nargs=2, default=DEFAULT_COMPONENTS, metavar=('X', 'Y'),
+                        help='BlurHash components (1~9 each, default: 4 3)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    if not all(1 <= c <= 9 for c in args.components):
+        parser.error('BlurHash components must be between 1 and 9')
+
+    index = build_placeholders(args.source, args.output, args.components, args.jobs)
+    total = os.path.getsize(args.output)
+    print(f"{len(index)} placeholders ({total / 1024:.1f} KB) → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
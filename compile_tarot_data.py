@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tarot Data Compiler
+Parses Tarot.csv once, validates it against TAROT_MAPPING and the card images,
+and emits a compact JSON bundle the app can index directly
+
+- Strict parsing: every row must have exactly 5 fields (line numbers are reported)
+- Keywords are resolved through TAROT_MAPPING (the " 역방향" suffix is stripped here, not at runtime)
+- Validates: T001-T156 present and unique, odd ID = upright / next even ID = its reversed form,
+  Image_File matches the mapping, every referenced image exists, every card appears exactly once
+- Bundle layout (public/fortune_data/tarot.json):
+    cards:   [{name, image, upright: {id, content}, reversed: {id, content}}]  (Tarot.csv order)
+    ids:     {"T001": [card index, 0 = upright / 1 = reversed]}
+    images:  {"major_00.jpg": card index}
+
+Usage:
+    python compile_tarot_data.py                 # validate + write public/fortune_data/tarot.json
+    python compile_tarot_data.py --check         # validate only
+"""
+
+import argparse
+import csv
+import json
+import os
+
+from process_tarot_images import default_source_dir
+from update_tarot_csv import TAROT_MAPPING
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TAROT_CSV_PATH = os.path.join(BASE_DIR, 'public', 'fortune_data', 'Tarot.csv')
+DEFAULT_OUTPUT_PATH = os.path.join(BASE_DIR, 'public', 'fortune_data', 'tarot.json')
+
+HEADER = ['Category', 'ID', 'Keyword', 'Content', 'Image_File']
+REVERSED_SUFFIX = ' 역방향'
+CARD_COUNT = 78
+BUNDLE_VERSION = 1
+
+
+class TarotDataError(Exception):
+    """Tarot.csv failed validation; .problems holds every message"""
+
+    def __init__(self, problems):
+        super().__init__(f"{len(problems)} problem(s) in tarot data")
+        self.problems = problems
+
+
+def read_rows(csv_path=TAROT_CSV_PATH):
+    """Parse Tarot.csv → ([(line number, row dict)], problems)"""
+    rows = []
+    problems = []
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        # 내용에 따옴표가 그대로 들어가 있으므로 인용 처리 없이 ; 로만 분리
+        reader = csv.reader(f, delimiter=';', quoting=csv.QUOTE_NONE)
+        header = next(reader, None)
+        if header != HEADER:
+            problems.append(f"line 1: expected header {';'.join(HEADER)}, got {';'.join(header or [])}")
+        for fields in reader:
+            line = reader.line_num
+            if not any(field.strip() for field in fields):
+                continue
+            if len(fields) != len(HEADER):
+                problems.append(f"line {line}: expected {len(HEADER)} fields, got {len(fields)}")
+                continue
+            rows.append((line, dict(zip(HEADER, (field.strip() for field in fields)))))
+    return rows, problems
+
+
+def compile_bundle(rows, image_dir=None):
+    """
+    Validate parsed rows and build the bundle dict.
+    Raises TarotDataError listing every problem found
+    """
+    problems = []
+    by_id = {}
+    for line, row in rows:
+        if row['ID'] in by_id:
+            problems.append(f"line {line}: duplicate ID {row['ID']} (first on line {by_id[row['ID']][0]})")
+        else:
+            by_id[row['ID']] = (line, row)
+
+    expected_ids = [f'T{n:03d}' for n in range(1, CARD_COUNT * 2 + 1)]
+    for row_id in sorted(set(by_id) - set(expected_ids)):
+        problems.append(f"line {by_id[row_id][0]}: unexpected ID {row_id}")
+
+    cards = []
+    seen_names = {}
+    # 홀수 ID = 정방향, 바로 다음 짝수 ID = 같은 카드의 역방향
+    for upright_id, reversed_id in zip(expected_ids[::2], expected_ids[1::2]):
+        if upright_id not in by_id or reversed_id not in by_id:
+            missing = [i for i in (upright_id, reversed_id) if i not in by_id]
+            problems.append(f"missing ID {', '.join(missing)}")
+            continue
+        (up_line, upright), (rev_line, reversed_) = by_id[upright_id], by_id[reversed_id]
+
+        name = upright['Keyword']
+        if name.endswith(REVERSED_SUFFIX):
+            problems.append(f"line {up_line}: {upright_id} should be upright but is '{name}'")
+            name = name[:-len(REVERSED_SUFFIX)]
+        if reversed_['Keyword'] != name + REVERSED_SUFFIX:
+            problems.append(f"line {rev_line}: {reversed_id} should be '{name}{REVERSED_SUFFIX}', "
+                            f"got '{reversed_['Keyword']}'")
+
+        image = TAROT_MAPPING.get(name)
+        if image is None:
+            problems.append(f"line {up_line}: no TAROT_MAPPING entry for '{name}'")
+            continue
+        for line, row in ((up_line, upright), (rev_line, reversed_)):
+            if row['Image_File'] != image:
+                problems.append(f"line {line}: {row['ID']} Image_File is {row['Image_File']}, mapping says {image}")
+        if name in seen_names:
+            problems.append(f"line {up_line}: card '{name}' already defined by {seen_names[name]}")
+            continue
+        seen_names[name] = upright_id
+
+        cards.append({
+            'name': name,
+            'image': image,
+            'upright': {'id': upright_id, 'content': upright['Content']},
+            'reversed': {'id': reversed_id, 'content': reversed_['Content']},
+        })
+
+    for name in sorted(set(TAROT_MAPPING) - set(seen_names)):
+        problems.append(f"card '{name}' ({TAROT_MAPPING[name]}) has no rows in Tarot.csv")
+
+    image_dir = image_dir or default_source_dir()
+    for image in sorted({card['image'] for card in cards}):
+        if not os.path.exists(os.path.join(image_dir, image)):
+            problems.append(f"image {image} not found in {image_dir}")
+
+    if problems:
+        raise TarotDataError(problems)
+
+    return {
+        'version': BUNDLE_VERSION,
+        'cards': cards,
+        'ids': {card[side]['id']: [index, flag]
+                for index, card in enumerate(cards)
+                for flag, side in enumerate(('upright', 'reversed'))},
+        'images': {card['image']: index for index, card in enumerate(cards)},
+    }
+
+
+def write_bundle(bundle, output_path=DEFAULT_OUTPUT_PATH):
+    """Write the bundle as compact UTF-8 JSON. Returns True if the file changed"""
+    data = json.dumps(bundle, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    try:
+        with open(output_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate Tarot.csv and compile it into an indexed JSON bundle')
+    parser.add_argument('--csv', default=TAROT_CSV_PATH, help='Tarot.csv path')
+    parser.add_argument('--images', default=None,
+                        help='Directory with the card JPEGs (default: public/images/tarot or the archive)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_PATH, help='Bundle path')
+    parser.add_argument('--check', action='store_true', help='Validate only, do not write the bundle')
+    args = parser.parse_args()
+
+    rows, problems = read_rows(args.csv)
+    try:
+        bundle = compile_bundle(rows, args.images)
+    except TarotDataError as e:
+        problems += e.problems
+    if problems:
+        for problem in problems:
+            print(f"ERROR {problem}")
+        raise SystemExit(f"\n{TarotDataError(problems)}")
+
+    print(f"{len(bundle['cards'])} cards / {len(bundle['ids'])} rows validated")
+    if args.check:
+        return
+    changed = write_bundle(bundle, args.output)
+    size = os.path.getsize(args.output)
+    print(f"{'Wrote' if changed else 'Unchanged'} {args.output} ({size / 1024:.1f} KB, "
+          f"Tarot.csv {os.path.getsize(args.csv) / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,33 @@
 """
 Rider-Waite Tarot Card Image Downloader
 Downloads all 78 tarot card images from Wikimedia Commons (public domain)
+
+- A small pool of keep-alive connections per host (no new TLS handshake per card)
+- A bounded number of concurrent fetches
+- Politeness via a token-bucket rate limiter instead of a fixed sleep
+- Downloads go to `.part` files and resume with HTTP Range requests after an interruption;
+  the part's ETag / Last-Modified is sent as If-Range so a changed remote file restarts cleanly
+- Each file is validated (size, SHA-256, JPEG decode) before an atomic rename
+- checksums.json records size + SHA-256 per image; re-runs verify files by hash
+  instead of trusting that they exist
+- checksums.json also keeps ETag / Last-Modified per image; --refresh sends
+  If-None-Match / If-Modified-Since so unchanged cards cost only a 304 with headers
+
+Usage:
+    python download_tarot.py                 # 4 workers, 5 requests/s
+    python download_tarot.py -j 8 --rate 10
 """
 
+import argparse
+import hashlib
+import http.client
+import json
 import os
-import urllib.request
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlsplit
 
 # Wikimedia Commons base URL for Rider-Waite tarot cards
 # These are public domain images from the original 1909 deck
@@ -100,52 +122,480 @@ TAROT_IMAGES = {
     'pentacles_14': 'https://upload.wikimedia.org/wikipedia/commons/1/1c/Pents14.jpg',
 }
 
-def download_tarot_images():
-    """Download all tarot card images to public/images/tarot/ directory"""
+DEFAULT_TARGET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public', 'images', 'tarot')
+
+# Wikimedia asks clients to identify themselves
+USER_AGENT = 'ShareNote-TarotDownloader/1.0 (https://github.com/zend-21/my-mindflow-app)'
+
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 5.0       # requests per second
+DEFAULT_BURST = 4        # requests allowed back-to-back
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024
+MAX_ATTEMPTS = 3
+PART_SUFFIX = '.part'
+# <file>.part.validator: ETag / Last-Modified the part file was started from (If-Range on resume)
+VALIDATOR_SUFFIX = '.validator'
+MANIFEST_NAME = 'checksums.json'
+
+
+# _save_part result for a 304 Not Modified response
+NOT_MODIFIED = object()
+
+
+class DownloadError(Exception):
+    """A download that must not be retried as-is (HTTP error or a file that fails validation)"""
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_valid_jpeg(path):
+    """SOI/EOI markers, plus a full decode when Pillow is installed"""
+    with open(path, 'rb') as f:
+        head = f.read(2)
+        f.seek(-2, os.SEEK_END)
+        tail = f.read(2)
+    if head != b'\xff\xd8' or tail != b'\xff\xd9':
+        return False
+    try:
+        from PIL import Image
+    except ImportError:
+        return True
+    try:
+        with Image.open(path) as img:
+            img.load()
+        return True
+    except Exception:
+        return False
+
+
+def validate_file(path, expected_size=None, expected_sha256=None):
+    """Check size, SHA-256 and JPEG decoding. Returns (size, sha256) or raises DownloadError"""
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        raise DownloadError(f'size mismatch: {size:,} != {expected_size:,} bytes')
+    sha256 = sha256_file(path)
+    if expected_sha256 and sha256 != expected_sha256:
+        raise DownloadError(f'SHA-256 mismatch: {sha256[:12]}… != {expected_sha256[:12]}…')
+    if not is_valid_jpeg(path):
+        raise DownloadError('not a valid JPEG')
+    return size, sha256
+
+
+def _part_validator(response):
+    """If-Range value for a response: strong ETag, else Last-Modified (None if neither)"""
+    etag = response.getheader('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.getheader('Last-Modified')
+
+
+def read_part_validator(part_path):
+    try:
+        with open(part_path + VALIDATOR_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def discard_part(part_path):
+    """Remove a part file and its recorded validator"""
+    for path in (part_path, part_path + VALIDATOR_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _save_part(response, part_path, offset):
+    """
+    Write a (partial) response body to the part file.
+    Returns the full file size announced by the server (None if unknown),
+    or NOT_MODIFIED for a 304 answer to a conditional request
+    """
+    if response.status == 304:
+        return NOT_MODIFIED
+
+    if response.status == 416 and offset:
+        # Nothing left to fetch: the part file is already complete
+        content_range = response.getheader('Content-Range', '')
+        return int(content_range.rsplit('/', 1)[1]) if '/' in content_range else None
+
+    if response.status == 206:
+        # Content-Range: bytes <start>-<end>/<total>
+        content_range = response.getheader('Content-Range', '')
+        start, _, total = content_range.replace('bytes ', '').replace('-', '/', 1).split('/')
+        if int(start) != offset:
+            raise DownloadError(f'unexpected range start {start} (wanted {offset})')
+        total = None if total == '*' else int(total)
+        mode = 'ab'
+    elif response.status == 200:
+        # Fresh download, or the server ignored Range / If-Range no longer matches: start over
+        length = response.getheader('Content-Length')
+        total = int(length) if length else None
+        mode = 'wb'
+        # Record the validator so a later resume can check the remote file has not changed
+        validator = _part_validator(response)
+        validator_path = part_path + VALIDATOR_SUFFIX
+        if validator:
+            with open(validator_path, 'w', encoding='utf-8') as f:
+                f.write(validator)
+        elif os.path.exists(validator_path):
+            os.remove(validator_path)
+    else:
+        raise DownloadError(f'HTTP {response.status} {response.reason}')
+
+    length = response.getheader('Content-Length')
+    received = 0
+    with open(part_path, mode) as f:
+        while chunk := response.read(CHUNK_SIZE):
+            f.write(chunk)
+            received += len(chunk)
+    if length and received < int(length):
+        # Connection dropped mid-body: keep what we have and resume
+        raise http.client.IncompleteRead(b'', int(length) - received)
+    return total
+
+
+class ChecksumManifest:
+    """
+    {image file: {url, size, sha256, etag, last_modified}} stored as JSON next to the images.
+    etag / last_modified are the validators for conditional refresh requests
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, name):
+        with self.lock:
+            return self.entries.get(name)
+
+    def set(self, name, **entry):
+        with self.lock:
+            self.entries[name] = entry
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `capacity` saved up"""
 
-    # Create target directory
-    target_dir = os.path.join(os.path.dirname(__file__), 'public', 'images', 'tarot')
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, reused per (scheme, host, port)"""
+
+    def __init__(self, max_per_host=DEFAULT_WORKERS, timeout=30):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def _queue(self, key):
+        with self.lock:
+            return self.idle.setdefault(key, queue.LifoQueue(self.max_per_host))
+
+    def get(self, scheme, host, port):
+        try:
+            return self._queue((scheme, host, port)).get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            return cls(host, port, timeout=self.timeout)
+
+    def put(self, scheme, host, port, conn):
+        try:
+            self._queue((scheme, host, port)).put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        with self.lock:
+            queues, self.idle = list(self.idle.values()), {}
+        for q in queues:
+            while not q.empty():
+                q.get_nowait().close()
+
+
+class Downloader:
+    """Concurrent, rate-limited downloader sharing one connection pool"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.workers = workers
+        self.limiter = TokenBucket(rate, burst)
+        self.pool = ConnectionPool(max_per_host=workers)
+
+    def request(self, url, headers=None, on_response=None):
+        """
+        GET `url` (following redirects) on a pooled connection.
+        `on_response(response)` is called with the open response and its result returned;
+        by default the body is read into memory. Returns (status, headers, result).
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme
+            port = parts.port or (443 if scheme == 'https' else 80)
+            path = parts.path + (f'?{parts.query}' if parts.query else '')
+            send_headers = {'User-Agent': USER_AGENT, **(headers or {})}
+
+            self.limiter.acquire()
+            for attempt in range(2):
+                conn = self.pool.get(scheme, parts.hostname, port)
+                try:
+                    conn.request('GET', path or '/', headers=send_headers)
+                    response = conn.getresponse()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                    # Stale keep-alive connection: retry once on a fresh one
+                    conn.close()
+                    if attempt:
+                        raise
+
+            redirect = response.status in (301, 302, 303, 307, 308)
+            try:
+                result = None if redirect or not on_response else on_response(response)
+                # The body must be fully consumed before the connection can be reused
+                body = response.read()
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self.pool.put(scheme, parts.hostname, port, conn)
+
+            if redirect:
+                url = urljoin(url, response.getheader('Location'))
+                continue
+            return response.status, response.headers, result if on_response else body
+
+        raise OSError(f'too many redirects: {url}')
+
+    def download(self, url, filepath, expected_sha256=None, validators=None):
+        """
+        Download `url` to `filepath` through `filepath.part`, resuming with a Range request
+        after an interruption. The part file is validated (size, SHA-256 if known, JPEG decode)
+        and then atomically renamed.
+        validators: manifest entry of the current file; sends If-None-Match / If-Modified-Since
+        Returns {size, sha256, etag, last_modified}, or None if the server answered 304
+        """
+        part_path = filepath + PART_SUFFIX
+        total = None
+        response_headers = {}
+        error = None
+
+        for _ in range(MAX_ATTEMPTS):
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            validator = read_part_validator(part_path) if offset else None
+            if offset and not validator:
+                # No way to tell whether the remote file changed since the part was started
+                discard_part(part_path)
+                offset = 0
+            if offset:
+                headers = {'Range': f'bytes={offset}-', 'If-Range': validator}
+            else:
+                headers = conditional_headers(validators)
+            try:
+                _, response_headers, total = self.request(
+                    url, headers, on_response=lambda r: _save_part(r, part_path, offset))
+                error = None
+                break
+            except DownloadError:
+                # The part file cannot be resumed (or the URL is broken): start over next time
+                discard_part(part_path)
+                raise
+            except (OSError, http.client.HTTPException) as e:
+                # Keep the .part file: the next attempt (or run) resumes from where it stopped
+                error = e
+        if error is not None:
+            raise error
+        if total is NOT_MODIFIED:
+            return None
+
+        try:
+            size, sha256 = validate_file(part_path, total, expected_sha256)
+        except DownloadError:
+            discard_part(part_path)
+            raise
+        os.replace(part_path, filepath)
+        discard_part(part_path)
+        return {
+            'size': size,
+            'sha256': sha256,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+        }
+
+    def close(self):
+        self.pool.close()
+
+
+def rebase_url(url, base_url):
+    """Point `url` at another scheme/host (e.g. a local stand-in server), keeping the path"""
+    base = urlsplit(base_url)
+    return url.replace(f"{urlsplit(url).scheme}://{urlsplit(url).netloc}", f"{base.scheme}://{base.netloc}", 1)
+
+def conditional_headers(entry):
+    """If-None-Match / If-Modified-Since from a manifest entry (empty if it has no validators)"""
+    headers = {}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def verify_existing(filepath, entry, url):
+    """
+    Check an existing image against its manifest entry.
+    Returns 'verified', 'adopted' (valid file with no entry yet) or None (download again)
+    """
+    if not os.path.exists(filepath):
+        return None
+    if entry is None:
+        try:
+            validate_file(filepath)
+            return 'adopted'
+        except (DownloadError, OSError):
+            return None
+    if entry.get('url') != url or os.path.getsize(filepath) != entry.get('size'):
+        return None
+    return 'verified' if sha256_file(filepath) == entry.get('sha256') else None
+
+def download_tarot_images(target_dir=DEFAULT_TARGET_DIR, images=TAROT_IMAGES,
+                          workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, burst=DEFAULT_BURST, refresh=False):
+    """
+    Verify, then download missing or corrupt cards concurrently. Returns the list of failed names
+    refresh: also re-check verified cards with conditional requests (unchanged cards cost a 304)
+    """
     os.makedirs(target_dir, exist_ok=True)
+    manifest = ChecksumManifest(os.path.join(target_dir, MANIFEST_NAME))
 
-    print(f"Downloading {len(TAROT_IMAGES)} Rider-Waite tarot card images...")
-    print(f"Target directory: {target_dir}\n")
+    print(f"Downloading {len(images)} Rider-Waite tarot card images...")
+    print(f"Target directory: {target_dir}")
+    print(f"{workers} workers, {rate:g} requests/s\n")
 
     success_count = 0
     failed = []
+    todo = {}
+    not_modified = 0
+    start = time.monotonic()
 
-    for filename, url in TAROT_IMAGES.items():
-        try:
+    # One pass over the existing files: hash them in parallel against the manifest
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        checks = {}
+        for filename, url in images.items():
             filepath = os.path.join(target_dir, f"{filename}.jpg")
+            entry = manifest.get(f"{filename}.jpg")
+            checks[filename] = (executor.submit(verify_existing, filepath, entry, url), url, filepath, entry)
 
-            # Skip if already exists
-            if os.path.exists(filepath):
-                print(f"OK {filename}.jpg (already exists)")
-                success_count += 1
+        for filename, (future, url, filepath, entry) in checks.items():
+            state = future.result()
+            if state is None:
+                # Re-downloading the same URL must reproduce the recorded hash
+                expected = entry['sha256'] if entry and entry.get('url') == url else None
+                todo[filename] = (url, filepath, expected, None)
                 continue
-
-            # Download image
-            urllib.request.urlretrieve(url, filepath)
-            print(f"OK {filename}.jpg downloaded")
+            if state == 'adopted':
+                manifest.set(f"{filename}.jpg", url=url, size=os.path.getsize(filepath),
+                             sha256=sha256_file(filepath))
+            elif refresh:
+                # The server may have a newer version: no expected hash, send validators
+                todo[filename] = (url, filepath, None, entry)
             success_count += 1
 
-            # Be nice to Wikimedia servers
-            time.sleep(0.2)
+    print(f"Verified {success_count} existing file(s) in {time.monotonic() - start:.2f}s")
 
-        except Exception as e:
-            print(f"FAIL {filename}.jpg failed: {e}")
-            failed.append(filename)
+    downloader = Downloader(workers, rate, burst)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(downloader.download, url, filepath, expected, validators):
+                       (filename, url, validators)
+                       for filename, (url, filepath, expected, validators) in todo.items()}
+            for future in as_completed(futures):
+                filename, url, validators = futures[future]
+                try:
+                    result = future.result()
+                    if result is None:
+                        not_modified += 1
+                        continue
+                    manifest.set(f"{filename}.jpg", url=url, **result)
+                    if validators is None:
+                        print(f"OK {filename}.jpg downloaded ({result['size']:,} bytes)")
+                        success_count += 1
+                    else:
+                        print(f"OK {filename}.jpg updated ({result['size']:,} bytes)")
+                except Exception as e:
+                    print(f"FAIL {filename}.jpg failed: {e}")
+                    failed.append(filename)
+    finally:
+        downloader.close()
+        manifest.save()
 
     print(f"\n{'='*50}")
-    print(f"Successfully downloaded: {success_count}/{len(TAROT_IMAGES)}")
+    print(f"Successfully downloaded: {success_count}/{len(images)} in {time.monotonic() - start:.1f}s")
+    if refresh:
+        print(f"Not modified (304): {not_modified}")
 
     if failed:
         print(f"Failed: {len(failed)}")
-        for f in failed:
+        for f in sorted(failed):
             print(f"   - {f}")
     else:
         print("All tarot card images downloaded successfully!")
 
     print(f"{'='*50}\n")
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description='Download the Rider-Waite tarot deck from Wikimedia Commons')
+    parser.add_argument('-o', '--output', default=DEFAULT_TARGET_DIR, help='Target directory')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_WORKERS, help='Concurrent downloads')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='Maximum requests per second')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST, help='Requests allowed back-to-back')
+    parser.add_argument('--base-url', default=None,
+                        help='Fetch the same paths from another server (e.g. http://127.0.0.1:8000 for testing)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-check existing cards with conditional requests (ETag / Last-Modified)')
+    args = parser.parse_args()
+
+    images = TAROT_IMAGES
+    if args.base_url:
+        images = {name: rebase_url(url, args.base_url) for name, url in images.items()}
+    failed = download_tarot_images(args.output, images, args.jobs, args.rate, args.burst, args.refresh)
+    raise SystemExit(1 if failed else 0)
 
 if __name__ == '__main__':
-    download_tarot_images()
+    main()
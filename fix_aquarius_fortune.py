@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 물병자리 운세의 IT 용어를 자연스러운 별자리 운세로 교체
+(patch_fortune_csv의 ID 기반 패치로 적용)
 """
 
 replacements = {
@@ -145,17 +146,24 @@ replacements = {
     "H_AQ_190;영향력 확대;물병자리가 영향력 있는 사람과 협력하는 날입니다. 협업하세요. 협업이 영향을 키웁니다.",
 }
 
-# 파일 읽기
-with open('e:\\React test\\my-mindflow-app\\public\\fortune_data\\horoscope.csv', 'r', encoding='utf-8') as f:
-    content = f.read()
 
-# 교체
-for old, new in replacements.items():
-    content = content.replace(old, new)
+if __name__ == '__main__':
+    import os
 
-# 파일 쓰기
-with open('e:\\React test\\my-mindflow-app\\public\\fortune_data\\horoscope.csv', 'w', encoding='utf-8') as f:
-    f.write(content)
+    from patch_fortune_csv import FORTUNE_DATA_DIR, add_patch, patch_files
 
-print("Aquarius fortune update complete!")
-print(f"Total {len(replacements)} items replaced")
+    # 교체 후 행에서 ID;키워드;내용만 뽑아 ID 기준 패치로 변환
+    patches = {}
+    sources = {}
+    for new in replacements.values():
+        row_id, keyword, content = new.split(';')
+        add_patch(patches, sources, row_id, {'Keyword': keyword, 'Content': content}, row_id)
+
+    targets = [os.path.join(FORTUNE_DATA_DIR, name) for name in ('horoscope.csv', 'horoscope_aquarius.csv')]
+    results, unmatched = patch_files(targets, patches)
+
+    print("Aquarius fortune update complete!")
+    for path, (applied, unchanged) in results.items():
+        print(f"{os.path.basename(path)}: {len(applied)} replaced, {len(unchanged)} already up to date")
+    if unmatched:
+        print(f"Not found: {', '.join(unmatched)}")
@@ -5,6 +5,8 @@ ShareNote 앱 아이콘 생성 스크립트
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+from icon_compose import create_round_icon
+
 # 아이콘 크기 정의 (Android)
 ICON_SIZES = {
     'mipmap-mdpi': 48,
@@ -108,19 +110,6 @@ def create_sharenote_icon(size):
 
     return img
 
-def create_round_icon(square_icon):
-    """정사각형 아이콘을 원형으로 만들기"""
-    size = square_icon.size[0]
-    mask = Image.new('L', (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, size, size], fill=255)
-
-    result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    result.paste(square_icon, (0, 0))
-    result.putalpha(mask)
-
-    return result
-
 def create_foreground_icon(size):
     """
     Adaptive Icon용 foreground
@@ -195,27 +184,28 @@ def create_foreground_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-# 아이콘 생성
-base_path = r'f:\React test\share-note\android\app\src\main\res'
+if __name__ == '__main__':
+    # 아이콘 생성
+    base_path = r'f:\React test\share-note\android\app\src\main\res'
 
-print('ShareNote app icon generation started...')
+    print('ShareNote app icon generation started...')
 
-for folder, size in ICON_SIZES.items():
-    folder_path = os.path.join(base_path, folder)
+    for folder, size in ICON_SIZES.items():
+        folder_path = os.path.join(base_path, folder)
 
-    # ic_launcher.png (정사각형)
-    square_icon = create_sharenote_icon(size)
-    square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher.png ({size}x{size})')
+        # ic_launcher.png (정사각형)
+        square_icon = create_sharenote_icon(size)
+        square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher.png ({size}x{size})')
 
-    # ic_launcher_round.png (원형)
-    round_icon = create_round_icon(square_icon)
-    round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
+        # ic_launcher_round.png (원형)
+        round_icon = create_round_icon(square_icon)
+        round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
 
-    # ic_launcher_foreground.png (Adaptive Icon용)
-    foreground_icon = create_foreground_icon(size)
-    foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
+        # ic_launcher_foreground.png (Adaptive Icon용)
+        foreground_icon = create_foreground_icon(size)
+        foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
 
-print('Icon generation completed!')
+    print('Icon generation completed!')
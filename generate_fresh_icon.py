@@ -8,6 +8,9 @@ from PIL import Image, ImageDraw
 import math
 import os
 
+from icon_compose import create_round_icon
+from icon_sdf import Circle, gradient_disc, rasterize
+
 ICON_SIZES = {
     'mipmap-mdpi': 48,
     'mipmap-hdpi': 72,
@@ -97,17 +100,39 @@ def create_fresh_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-def create_round_icon(square_icon):
-    """원형 마스크"""
-    size = square_icon.size[0]
-    mask = Image.new('L', (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, size, size], fill=255)
+def fresh_scene(padding=0.25, background=True):
+    """
+    fresh 디자인의 SDF 레이어 목록 (0~1 정규화 좌표)
+    padding 0.25 = 정사각형 아이콘, 0.30 = Adaptive Icon foreground
+    """
+    content_size = 1 - padding * 2
+    circle_radius = content_size * 0.25
+    center_dot_radius = circle_radius * 0.35
+
+    layers = []
+    if background:
+        layers.append(gradient_disc((6, 182, 212, 255), (8, 145, 178, 255)))
+
+    layers += [
+        (Circle(padding + content_size * 0.3, 0.5, circle_radius), (255, 255, 255, 220)),
+        (Circle(padding + content_size * 0.7, padding + content_size * 0.35, circle_radius), (251, 191, 36, 220)),
+        (Circle(padding + content_size * 0.7, padding + content_size * 0.65, circle_radius), (251, 113, 133, 220)),
+        (Circle(padding + content_size * 0.52, 0.5, center_dot_radius), (255, 255, 255, 255)),
+    ]
+    return layers
+
+def create_fresh_icon_sdf(size):
+    """fresh 아이콘을 SDF로 목표 크기에 직접 래스터화 (슈퍼샘플링 없음)"""
+    return rasterize(fresh_scene(), size, blend='copy')
+
+def create_foreground_icon_sdf(size):
+    """fresh Adaptive Icon foreground (SDF)"""
+    return rasterize(fresh_scene(padding=0.30, background=False), size, blend='copy')
 
-    result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    result.paste(square_icon, (0, 0))
-    result.putalpha(mask)
-    return result
+def fresh_adaptive_layers():
+    """fresh Adaptive Icon 벡터 레이어: (배경 채우기, foreground 레이어 목록)"""
+    _, background_fill = gradient_disc((6, 182, 212, 255), (8, 145, 178, 255))
+    return background_fill, fresh_scene(padding=0.30, background=False)
 
 def create_foreground_icon(size):
     """Adaptive Icon용 foreground"""
@@ -166,31 +191,32 @@ def create_foreground_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-# 아이콘 생성
-base_path = r'f:\React test\share-note\android\app\src\main\res'
+if __name__ == '__main__':
+    # 아이콘 생성
+    base_path = r'f:\React test\share-note\android\app\src\main\res'
 
-print('Fresh ShareNote icon generation started...')
+    print('Fresh ShareNote icon generation started...')
 
-for folder, size in ICON_SIZES.items():
-    folder_path = os.path.join(base_path, folder)
+    for folder, size in ICON_SIZES.items():
+        folder_path = os.path.join(base_path, folder)
 
-    square_icon = create_fresh_icon(size)
-    square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher.png ({size}x{size})')
+        square_icon = create_fresh_icon(size)
+        square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher.png ({size}x{size})')
 
-    round_icon = create_round_icon(square_icon)
-    round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
+        round_icon = create_round_icon(square_icon)
+        round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
 
-    foreground_icon = create_foreground_icon(size)
-    foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
+        foreground_icon = create_foreground_icon(size)
+        foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
 
-print('\nFresh icon generation completed!')
-print('')
-print('Design Features:')
-print('- Modern mint-teal gradient background')
-print('- Abstract overlapping circles pattern')
-print('- White, amber, and rose colors for visual interest')
-print('- Central connection point symbolizing sharing')
-print('- Minimalist and contemporary aesthetic')
+    print('\nFresh icon generation completed!')
+    print('')
+    print('Design Features:')
+    print('- Modern mint-teal gradient background')
+    print('- Abstract overlapping circles pattern')
+    print('- White, amber, and rose colors for visual interest')
+    print('- Central connection point symbolizing sharing')
+    print('- Minimalist and contemporary aesthetic')
@@ -7,6 +7,8 @@ ShareNote 모던 아이콘
 from PIL import Image, ImageDraw
 import os
 
+from icon_compose import create_round_icon
+
 ICON_SIZES = {
     'mipmap-mdpi': 48,
     'mipmap-hdpi': 72,
@@ -124,18 +126,6 @@ def create_modern_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-def create_round_icon(square_icon):
-    """원형 마스크"""
-    size = square_icon.size[0]
-    mask = Image.new('L', (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, size, size], fill=255)
-
-    result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    result.paste(square_icon, (0, 0))
-    result.putalpha(mask)
-    return result
-
 def create_foreground_icon(size):
     """Adaptive Icon용 foreground"""
     scale = 4
@@ -220,31 +210,32 @@ def create_foreground_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-# 아이콘 생성
-base_path = r'f:\React test\share-note\android\app\src\main\res'
+if __name__ == '__main__':
+    # 아이콘 생성
+    base_path = r'f:\React test\share-note\android\app\src\main\res'
 
-print('Modern ShareNote icon generation started...')
+    print('Modern ShareNote icon generation started...')
 
-for folder, size in ICON_SIZES.items():
-    folder_path = os.path.join(base_path, folder)
+    for folder, size in ICON_SIZES.items():
+        folder_path = os.path.join(base_path, folder)
 
-    square_icon = create_modern_icon(size)
-    square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher.png ({size}x{size})')
+        square_icon = create_modern_icon(size)
+        square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher.png ({size}x{size})')
 
-    round_icon = create_round_icon(square_icon)
-    round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
+        round_icon = create_round_icon(square_icon)
+        round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
 
-    foreground_icon = create_foreground_icon(size)
-    foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
+        foreground_icon = create_foreground_icon(size)
+        foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
 
-print('\nModern icon generation completed!')
-print('')
-print('Design Features:')
-print('- Modern blue-purple gradient background')
-print('- Minimalist note icon with clean lines')
-print('- Share concept represented by connected nodes')
-print('- Green accent dot for visual interest')
-print('- Professional and contemporary look')
+    print('\nModern icon generation completed!')
+    print('')
+    print('Design Features:')
+    print('- Modern blue-purple gradient background')
+    print('- Minimalist note icon with clean lines')
+    print('- Share concept represented by connected nodes')
+    print('- Green accent dot for visual interest')
+    print('- Professional and contemporary look')
@@ -5,6 +5,8 @@ ShareNote 앱 아이콘 생성 v2
 from PIL import Image, ImageDraw
 import os
 
+from icon_compose import create_round_icon
+
 ICON_SIZES = {
     'mipmap-mdpi': 48,
     'mipmap-hdpi': 72,
@@ -137,18 +139,6 @@ def create_sharenote_icon_v2(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-def create_round_icon(square_icon):
-    """원형 마스크 적용"""
-    size = square_icon.size[0]
-    mask = Image.new('L', (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, size, size], fill=255)
-
-    result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    result.paste(square_icon, (0, 0))
-    result.putalpha(mask)
-    return result
-
 def create_foreground_icon(size):
     """Adaptive Icon용 foreground (배경 투명)"""
     scale = 4
@@ -227,30 +217,31 @@ def create_foreground_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-# 아이콘 생성
-base_path = r'f:\React test\share-note\android\app\src\main\res'
+if __name__ == '__main__':
+    # 아이콘 생성
+    base_path = r'f:\React test\share-note\android\app\src\main\res'
 
-print('ShareNote app icon v2 generation started...')
+    print('ShareNote app icon v2 generation started...')
 
-for folder, size in ICON_SIZES.items():
-    folder_path = os.path.join(base_path, folder)
+    for folder, size in ICON_SIZES.items():
+        folder_path = os.path.join(base_path, folder)
 
-    square_icon = create_sharenote_icon_v2(size)
-    square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher.png ({size}x{size})')
+        square_icon = create_sharenote_icon_v2(size)
+        square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher.png ({size}x{size})')
 
-    round_icon = create_round_icon(square_icon)
-    round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
+        round_icon = create_round_icon(square_icon)
+        round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
 
-    foreground_icon = create_foreground_icon(size)
-    foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
+        foreground_icon = create_foreground_icon(size)
+        foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
 
-print('Icon generation v2 completed!')
-print('')
-print('Design concept:')
-print('- Gradient background (Purple to Blue) - modern and professional')
-print('- Note/Document icon - represents note-taking feature')
-print('- Share icon with 3 nodes - represents collaboration and sharing')
-print('- Clean and minimal design')
+    print('Icon generation v2 completed!')
+    print('')
+    print('Design concept:')
+    print('- Gradient background (Purple to Blue) - modern and professional')
+    print('- Note/Document icon - represents note-taking feature')
+    print('- Share icon with 3 nodes - represents collaboration and sharing')
+    print('- Clean and minimal design')
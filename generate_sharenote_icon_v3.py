@@ -6,6 +6,9 @@ ShareNote 앱 아이콘 v3
 from PIL import Image, ImageDraw
 import os
 
+from icon_compose import create_round_icon
+from icon_sdf import Circle, Polygon, RoundedRect, gradient_disc, rasterize
+
 ICON_SIZES = {
     'mipmap-mdpi': 48,
     'mipmap-hdpi': 72,
@@ -123,17 +126,77 @@ def create_sharenote_icon_v3(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-def create_round_icon(square_icon):
-    """원형 마스크"""
-    size = square_icon.size[0]
-    mask = Image.new('L', (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse([0, 0, size, size], fill=255)
+def v3_scene(padding=0.18, background=True):
+    """
+    v3 디자인(문서 + 말풍선)의 SDF 레이어 목록 (0~1 정규화 좌표)
+    padding 0.18 = 정사각형 아이콘, 0.25 = Adaptive Icon foreground
+    """
+    content_size = 1 - padding * 2
+
+    layers = []
+    if background:
+        layers.append(gradient_disc((10, 10, 10, 255), (26, 26, 26, 255)))
+
+    # 문서
+    doc_width = content_size * 0.55
+    doc_height = content_size * 0.7
+    doc_x = padding + content_size * 0.15
+    doc_y = padding + content_size * 0.15
+    corner_radius = 0.05
+
+    layers.append((RoundedRect(doc_x, doc_y, doc_x + doc_width, doc_y + doc_height, corner_radius),
+                   (255, 255, 255, 255)))
+
+    # 헤더
+    header_height = doc_height * 0.15
+    layers.append((RoundedRect(doc_x, doc_y, doc_x + doc_width, doc_y + header_height, corner_radius),
+                   (99, 102, 241, 255)))
+
+    # 라인 (PIL line처럼 끝이 평평한 얇은 사각형)
+    line_width = 0.01
+    line_spacing = doc_height * 0.12
+    line_start_x = doc_x + doc_width * 0.12
+    line_end_x = doc_x + doc_width * 0.88
+
+    for i in range(4):
+        line_y = doc_y + header_height + doc_height * 0.15 + (i * line_spacing)
+        end_x = line_end_x if i < 3 else line_start_x + doc_width * 0.5
+        layers.append((RoundedRect(line_start_x, line_y - line_width / 2, end_x, line_y + line_width / 2),
+                       (200, 200, 200, 255)))
+
+    # 말풍선 (원 + 꼬리 합집합)
+    bubble_size = content_size * 0.35
+    bubble_x = doc_x + doc_width - bubble_size * 0.3
+    bubble_y = doc_y + doc_height - bubble_size * 0.5
+
+    bubble = Circle(bubble_x + bubble_size / 2, bubble_y + bubble_size / 2, bubble_size / 2)
+    tail = Polygon([
+        (bubble_x + bubble_size * 0.2, bubble_y + bubble_size * 0.85),
+        (bubble_x + bubble_size * 0.05, bubble_y + bubble_size * 1.1),
+        (bubble_x + bubble_size * 0.35, bubble_y + bubble_size * 0.75),
+    ])
+    layers.append((bubble | tail, (34, 197, 94, 255)))
+
+    # 말풍선 내부 점 3개
+    dot_radius = bubble_size * 0.04
+    for i in range(3):
+        layers.append((Circle(bubble_x + bubble_size * (0.25 + i * 0.25), bubble_y + bubble_size * 0.45, dot_radius),
+                       (255, 255, 255, 255)))
+
+    return layers
+
+def create_sharenote_icon_v3_sdf(size):
+    """v3 아이콘을 SDF로 목표 크기에 직접 래스터화 (슈퍼샘플링 없음)"""
+    return rasterize(v3_scene(), size)
+
+def create_foreground_icon_sdf(size):
+    """v3 Adaptive Icon foreground (SDF)"""
+    return rasterize(v3_scene(padding=0.25, background=False), size)
 
-    result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    result.paste(square_icon, (0, 0))
-    result.putalpha(mask)
-    return result
+def v3_adaptive_layers():
+    """v3 Adaptive Icon 벡터 레이어: (배경 채우기, foreground 레이어 목록)"""
+    _, background_fill = gradient_disc((10, 10, 10, 255), (26, 26, 26, 255))
+    return background_fill, v3_scene(padding=0.25, background=False)
 
 def create_foreground_icon(size):
     """Adaptive Icon용 foreground"""
@@ -212,30 +275,31 @@ def create_foreground_icon(size):
     img = img.resize((size, size), Image.Resampling.LANCZOS)
     return img
 
-# 아이콘 생성
-base_path = r'f:\React test\share-note\android\app\src\main\res'
+if __name__ == '__main__':
+    # 아이콘 생성
+    base_path = r'f:\React test\share-note\android\app\src\main\res'
 
-print('ShareNote app icon v3 generation started...')
+    print('ShareNote app icon v3 generation started...')
 
-for folder, size in ICON_SIZES.items():
-    folder_path = os.path.join(base_path, folder)
+    for folder, size in ICON_SIZES.items():
+        folder_path = os.path.join(base_path, folder)
 
-    square_icon = create_sharenote_icon_v3(size)
-    square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher.png ({size}x{size})')
+        square_icon = create_sharenote_icon_v3(size)
+        square_icon.save(os.path.join(folder_path, 'ic_launcher.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher.png ({size}x{size})')
 
-    round_icon = create_round_icon(square_icon)
-    round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
+        round_icon = create_round_icon(square_icon)
+        round_icon.save(os.path.join(folder_path, 'ic_launcher_round.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_round.png ({size}x{size})')
 
-    foreground_icon = create_foreground_icon(size)
-    foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
-    print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
+        foreground_icon = create_foreground_icon(size)
+        foreground_icon.save(os.path.join(folder_path, 'ic_launcher_foreground.png'), 'PNG')
+        print(f'Created {folder}/ic_launcher_foreground.png ({size}x{size})')
 
-print('Icon generation v3 completed!')
-print('')
-print('Design v3:')
-print('- Dark gradient background (dark blue)')
-print('- Document with speech bubble attached')
-print('- Green bubble represents chat/sharing')
-print('- Clean and professional')
+    print('Icon generation v3 completed!')
+    print('')
+    print('Design v3:')
+    print('- Dark gradient background (dark blue)')
+    print('- Document with speech bubble attached')
+    print('- Green bubble represents chat/sharing')
+    print('- Clean and professional')
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+안드로이드 스플래시 이미지 생성 스크립트
+- drawable/splash.png + drawable-port-* / drawable-land-* (mdpi ~ xxxhdpi) 11개 출력
+- 세로 그라데이션 배경 + 가운데 로고 (build_icons의 adaptive 레이어를 SDF로 그대로 사용)
+- 가로 스트립 단위로 렌더링해 바로 PNG 인코더(zlib 스트림)로 흘려보냄
+  → xxxhdpi 가로 크기도 메모리는 스트립 하나 분량만 사용
+- 11개 출력을 프로세스 풀로 병렬 렌더링, 내용이 같으면 파일을 다시 쓰지 않음
+
+사용 예:
+    python generate_splash.py                  # v3-sdf 디자인으로 res 폴더에 설치
+    python generate_splash.py fresh-sdf -o build/splash
+"""
+import argparse
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from build_icons import ANDROID_RES_DIR, DESIGNS
+from icon_sdf import RadialGradient, render_premultiplied
+
+# 출력 폴더 → (가로, 세로) 픽셀
+SPLASH_SIZES = {
+    'drawable': (480, 320),
+    'drawable-land-mdpi': (480, 320),
+    'drawable-land-hdpi': (800, 480),
+    'drawable-land-xhdpi': (1280, 720),
+    'drawable-land-xxhdpi': (1600, 960),
+    'drawable-land-xxxhdpi': (1920, 1280),
+    'drawable-port-mdpi': (320, 480),
+    'drawable-port-hdpi': (480, 800),
+    'drawable-port-xhdpi': (720, 1280),
+    'drawable-port-xxhdpi': (960, 1600),
+    'drawable-port-xxxhdpi': (1280, 1920),
+}
+
+DEFAULT_DESIGN = 'v3-sdf'
+
+# 로고(adaptive foreground 108dp 캔버스) 크기 = 짧은 변 × 비율
+LOGO_SCALE = 0.6
+
+# 한 번에 렌더링 / 압축하는 행 수
+STRIP_HEIGHT = 64
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def splash_theme(design):
+    """디자인의 adaptive 레이어 → (위쪽 색, 아래쪽 색, 로고 레이어)"""
+    background_fill, logo_layers = DESIGNS[design]['adaptive']()
+    if isinstance(background_fill, RadialGradient):
+        # 그라데이션 안쪽 색(위) → 가장자리 색(아래)
+        top, bottom = background_fill.stops[0][1], background_fill.stops[-1][1]
+    else:
+        top = bottom = background_fill
+    return top, bottom, logo_layers
+
+
+def _chunk(tag, data):
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+
+def filter_rows(rows, previous):
+    """
+    PNG 행 필터 선택 (None / Sub / Up 중 절댓값 합이 가장 작은 것, libpng 휴리스틱)
+    rows: (H, W*3) uint8, previous: 바로 위 행 (첫 행이면 0)
+    반환: 필터 타입 바이트가 붙은 (H, 1 + W*3) uint8
+    """
+    above = np.vstack([previous[None, :], rows[:-1]])
+    left = np.zeros_like(rows)
+    left[:, 3:] = rows[:, :-3]
+
+    candidates = np.stack([rows, rows - left, rows - above])  # uint8 wraparound = mod 256
+    cost = np.abs(candidates.astype(np.int8).astype(np.int32)).sum(axis=2)
+    choice = cost.argmin(axis=0)
+
+    filtered = candidates[choice, np.arange(len(rows))]
+    return np.hstack([choice.astype(np.uint8)[:, None], filtered])
+
+
+def render_strip(width, height, y0, y1, theme):
+    """y0 ~ y1 행의 RGB 픽셀 (uint8, (y1 - y0, W, 3))"""
+    top, bottom, logo_layers = theme
+
+    # 세로 그라데이션 배경
+    t = (np.arange(y0, y1, dtype=np.float32) + 0.5) / height
+    top_rgb = np.asarray(top[:3], dtype=np.float32) / 255
+    bottom_rgb = np.asarray(bottom[:3], dtype=np.float32) / 255
+    background = top_rgb + (bottom_rgb - top_rgb) * t[:, None]
+    strip = np.broadcast_to(background[:, None, :], (y1 - y0, width, 3)).copy()
+
+    # 로고가 걸치는 영역만 SDF 렌더링 후 over 합성
+    logo_size = round(min(width, height) * LOGO_SCALE)
+    logo_x = (width - logo_size) // 2
+    logo_y = (height - logo_size) // 2
+    ly0, ly1 = max(y0, logo_y), min(y1, logo_y + logo_size)
+    if ly0 < ly1:
+        xs = (np.arange(logo_size, dtype=np.float32) + 0.5) / logo_size
+        ys = (np.arange(ly0, ly1, dtype=np.float32) - logo_y + 0.5) / logo_size
+        x, y = np.meshgrid(xs, ys)
+        logo = render_premultiplied(logo_layers, logo_size, x, y)
+
+        region = strip[ly0 - y0:ly1 - y0, logo_x:logo_x + logo_size]
+        region[:] = logo[..., :3] + region * (1 - logo[..., 3:4])
+
+    return np.round(strip * 255).astype(np.uint8)
+
+
+def write_splash(path, width, height, theme, strip_height=STRIP_HEIGHT):
+    """
+    스트립 단위로 렌더링 → 필터 → zlib 스트림으로 PNG 기록
+    임시 파일에 쓴 뒤 기존 파일과 내용이 같으면 버린다. 실제로 바꿨으면 True
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    compressor = zlib.compressobj(9)
+    previous = np.zeros(width * 3, dtype=np.uint8)
+
+    with open(tmp_path, 'wb') as f:
+        f.write(PNG_SIGNATURE)
+        # 8비트 RGB, 인터레이스 없음
+        f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+
+        for y0 in range(0, height, strip_height):
+            y1 = min(y0 + strip_height, height)
+            rows = render_strip(width, height, y0, y1, theme).reshape(y1 - y0, width * 3)
+            data = compressor.compress(filter_rows(rows, previous).tobytes())
+            if data:
+                f.write(_chunk(b'IDAT', data))
+            previous = rows[-1]
+
+        f.write(_chunk(b'IDAT', compressor.flush()))
+        f.write(_chunk(b'IEND', b''))
+
+    if _same_file(tmp_path, path):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def _same_file(a, b):
+    try:
+        if os.path.getsize(a) != os.path.getsize(b):
+            return False
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            return fa.read() == fb.read()
+    except OSError:
+        return False
+
+
+def _splash_job(args):
+    folder, path, design = args
+    width, height = SPLASH_SIZES[folder]
+    return folder, width, height, write_splash(path, width, height, splash_theme(design))
+
+
+def generate_splashes(design=DEFAULT_DESIGN, res_root=ANDROID_RES_DIR, folders=None, workers=None):
+    """모든 스플래시 출력을 병렬 생성. {폴더: 기록 여부} 반환"""
+    jobs = [(folder, os.path.join(res_root, folder, 'splash.png'), design)
+            for folder in (folders or SPLASH_SIZES)]
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(_splash_job, job) for job in jobs]):
+            folder, width, height, written = future.result()
+            results[folder] = written
+            print(f"{'Created' if written else 'Unchanged'} {folder}/splash.png ({width}x{height})")
+    return results
+
+
+def main():
+    splash_designs = [d for d in DESIGNS if 'adaptive' in DESIGNS[d]]
+    parser = argparse.ArgumentParser(description='안드로이드 스플래시 이미지 생성')
+    parser.add_argument('design', nargs='?', default=DEFAULT_DESIGN, choices=splash_designs,
+                        help=f'로고 디자인 (기본: {DEFAULT_DESIGN})')
+    parser.add_argument('-o', '--output-root', default=ANDROID_RES_DIR,
+                        help='res 루트 디렉토리 (기본: android res 폴더)')
+    parser.add_argument('--folder', action='append', choices=list(SPLASH_SIZES),
+                        help='특정 출력 폴더만 생성 (반복 지정 가능)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='워커 프로세스 수')
+    args = parser.parse_args()
+
+    results = generate_splashes(args.design, args.output_root, args.folder, args.jobs)
+    print(f'\nSplash generation completed! {sum(results.values())} written, '
+          f'{len(results) - sum(results.values())} unchanged → {args.output_root}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+아이콘 렌더링 벤치마크 + 지각적 회귀 검사
+- 디자인 × 밀도마다 단계별(square, foreground, derive, encode) 벽시계 시간 측정
+- 작업마다 새 워커 프로세스에서 실행해 최대 RSS를 작업 단위로 기록
+- Image.new 호출을 세어 렌더러가 만든 캔버스 픽셀 수 기록 (슈퍼샘플링 비용 확인용)
+- 골든 PNG와 비교: 흰 배경 / 검은 배경에 합성한 뒤 CIELAB ΔE(CIE76)로 차이 측정
+  99백분위 ΔE와 최대 알파 차이가 허용치를 넘으면 실패
+
+그라데이션 / 슈퍼샘플링 / 파이프라인 최적화 전에 --update-golden으로 골든을 만들고
+변경 후 다시 실행해 눈에 보이는 차이가 없음을 확인한다.
+
+사용 예:
+    python icon_bench.py --update-golden          # 현재 출력을 골든으로 저장
+    python icon_bench.py                          # 측정 + 골든 비교 (차이가 있으면 종료 코드 1)
+    python icon_bench.py v3 fresh --json bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from build_icons import DESIGNS, ICON_SIZES, VARIANT_FILES, design_variants
+import icon_compose
+import icon_encode
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GOLDEN_DIR = os.path.join(BASE_DIR, 'build', 'icon-golden')
+
+# 기본 측정 대상 (기존 스크립트 디자인)
+DEFAULT_DESIGNS = ['app', 'fresh', 'modern', 'v2', 'v3', 'v4']
+
+# 허용치: ΔE 2.3 ≈ 사람이 겨우 구별하는 차이 (JND)
+DEFAULT_TOLERANCE = 2.3
+ALPHA_TOLERANCE = 8
+
+
+def _peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB). Linux는 KB, macOS는 바이트 단위. Windows는 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class CanvasCounter:
+    """with 블록 안에서 Image.new로 만들어진 캔버스 픽셀 수를 센다"""
+
+    def __enter__(self):
+        self.total = 0
+        self.largest = 0
+        self._original = Image.new
+
+        def counting_new(mode, size, *args, **kwargs):
+            pixels = size[0] * size[1]
+            self.total += pixels
+            self.largest = max(self.largest, pixels)
+            return self._original(mode, size, *args, **kwargs)
+
+        Image.new = counting_new
+        return self
+
+    def __exit__(self, *exc):
+        Image.new = self._original
+        return False
+
+
+def bench_job(job):
+    """
+    워커 작업: (design, folder, size) 렌더링 + 단계별 측정
+    반환: (측정 결과 dict, {variant: RGBA 바이트})
+    """
+    design, folder, size = job
+    entry = DESIGNS[design]
+    variants = design_variants(design)
+    stages = {}
+    images = {}
+
+    def timed(stage, fn):
+        with CanvasCounter() as counter:
+            start = time.perf_counter()
+            result = fn()
+            stages[stage] = {
+                'seconds': time.perf_counter() - start,
+                'canvas_pixels': counter.total,
+                'largest_canvas': counter.largest,
+            }
+        return result
+
+    square = timed('square', lambda: entry['square'](size))
+    derived = [v for v in variants if v in icon_compose.DERIVED_VARIANTS]
+    images.update(timed('derive', lambda: icon_compose.derive_variants(square, ['square'] + derived)))
+    if 'foreground' in entry:
+        images['foreground'] = timed('foreground', lambda: entry['foreground'](size))
+
+    timed('encode', lambda: [icon_encode.encode_png(img) for img in images.values()])
+
+    result = {
+        'design': design,
+        'folder': folder,
+        'size': size,
+        'stages': stages,
+        'seconds': sum(stage['seconds'] for stage in stages.values()),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+    return result, {variant: (img.convert('RGBA').tobytes(), img.size) for variant, img in images.items()}
+
+
+def _srgb_to_lab(rgb):
+    """sRGB (..., 3) 0~1 → CIELAB (D65)"""
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    matrix = np.array([[0.4124, 0.3576, 0.1805],
+                       [0.2126, 0.7152, 0.0722],
+                       [0.0193, 0.1192, 0.9505]], dtype=np.float32)
+    xyz = linear @ matrix.T / np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+    return np.stack([116 * f[..., 1] - 16,
+                     500 * (f[..., 0] - f[..., 1]),
+                     200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def perceptual_diff(a, b):
+    """
+    두 RGBA 이미지의 지각적 차이
+    흰 배경 / 검은 배경에 각각 합성한 뒤 ΔE를 구해 픽셀마다 큰 값을 사용
+    반환: {'mean', 'p99', 'max', 'alpha'} (alpha는 최대 알파 차이, 0~255)
+    """
+    a = np.asarray(a.convert('RGBA'), dtype=np.float32) / 255
+    b = np.asarray(b.convert('RGBA'), dtype=np.float32) / 255
+
+    delta = None
+    for backdrop in (0.0, 1.0):
+        lab_a = _srgb_to_lab(a[..., :3] * a[..., 3:4] + backdrop * (1 - a[..., 3:4]))
+        lab_b = _srgb_to_lab(b[..., :3] * b[..., 3:4] + backdrop * (1 - b[..., 3:4]))
+        de = np.sqrt(((lab_a - lab_b) ** 2).sum(axis=-1))
+        delta = de if delta is None else np.maximum(delta, de)
+
+    return {
+        'mean': float(delta.mean()),
+        'p99': float(np.percentile(delta, 99)),
+        'max': float(delta.max()),
+        'alpha': float(np.abs(a[..., 3] - b[..., 3]).max() * 255),
+    }
+
+
+def golden_path(golden_dir, design, folder, variant):
+    return os.path.join(golden_dir, design, folder, VARIANT_FILES[variant])
+
+
+def run_bench(designs, densities=None, golden_dir=DEFAULT_GOLDEN_DIR, update_golden=False,
+              tolerance=DEFAULT_TOLERANCE, workers=None):
+    """
+    벤치마크 + 골든 비교 실행
+    반환: (측정 결과 목록, 회귀 목록 [(design, folder, variant, diff 또는 None)])
+    diff가 None이면 골든 파일이 없는 경우
+    """
+    jobs = [(design, folder, size) for design in designs for folder, size in ICON_SIZES.items()
+            if not densities or folder in densities]
+    results = []
+    failures = []
+
+    # 작업마다 새 프로세스 → 최대 RSS가 다른 작업과 섞이지 않음
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        for result, images in pool.map(bench_job, jobs):
+            results.append(result)
+            design, folder = result['design'], result['folder']
+            result['diff'] = {}
+
+            for variant, (data, size) in images.items():
+                img = Image.frombytes('RGBA', size, data)
+                path = golden_path(golden_dir, design, folder, variant)
+
+                if update_golden:
+                    icon_encode.write_if_changed(path, icon_encode.encode_png(img)[0])
+                    continue
+                if not os.path.exists(path):
+                    failures.append((design, folder, variant, None))
+                    continue
+
+                diff = perceptual_diff(img, Image.open(path))
+                result['diff'][variant] = diff
+                if diff['p99'] > tolerance or diff['alpha'] > ALPHA_TOLERANCE:
+                    failures.append((design, folder, variant, diff))
+
+    return results, failures
+
+
+def print_report(results):
+    """디자인 × 밀도별 측정 결과 표 출력"""
+    print(f"{'design':<10} {'density':<16} {'size':>5} {'total ms':>9} {'square':>8} {'fg':>8} "
+          f"{'derive':>7} {'encode':>7} {'canvas px':>11} {'RSS MB':>7} {'p99 ΔE':>7}")
+    for result in results:
+        stages = result['stages']
+        ms = {name: stages[name]['seconds'] * 1000 if name in stages else 0.0
+              for name in ('square', 'foreground', 'derive', 'encode')}
+        canvas = sum(stage['canvas_pixels'] for stage in stages.values())
+        rss = '-' if result['peak_rss_mb'] is None else f"{result['peak_rss_mb']:.1f}"
+        worst = max((diff['p99'] for diff in result['diff'].values()), default=None)
+        print(f"{result['design']:<10} {result['folder']:<16} {result['size']:>5} "
+              f"{result['seconds'] * 1000:>9.1f} {ms['square']:>8.1f} {ms['foreground']:>8.1f} "
+              f"{ms['derive']:>7.1f} {ms['encode']:>7.1f} {canvas:>11,} {rss:>7} "
+              f"{'-' if worst is None else f'{worst:.2f}':>7}")
+
+    by_design = {}
+    for result in results:
+        by_design[result['design']] = by_design.get(result['design'], 0) + result['seconds']
+    print('\nTotal per design: ' + ', '.join(f'{d} {s * 1000:.0f} ms' for d, s in by_design.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아이콘 렌더링 벤치마크 + 지각적 회귀 검사')
+    parser.add_argument('designs', nargs='*', metavar='design',
+                        help=f'측정할 디자인 (기본: {", ".join(DEFAULT_DESIGNS)}) - {", ".join(DESIGNS)}')
+    parser.add_argument('--density', action='append', choices=list(ICON_SIZES),
+                        help='특정 밀도만 측정 (반복 지정 가능)')
+    parser.add_argument('--golden', default=DEFAULT_GOLDEN_DIR, help='골든 PNG 디렉토리')
+    parser.add_argument('--update-golden', action='store_true', help='현재 출력을 골든으로 저장')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'허용 99백분위 ΔE (기본: {DEFAULT_TOLERANCE})')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='워커 프로세스 수 (기본 1: 측정끼리 CPU를 다투지 않도록)')
+    parser.add_argument('--json', default=None, help='측정 결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    designs = args.designs or DEFAULT_DESIGNS
+    unknown = [d for d in designs if d not in DESIGNS]
+    if unknown:
+        parser.error(f'알 수 없는 디자인: {", ".join(unknown)}')
+
+    results, failures = run_bench(designs, args.density, args.golden, args.update_golden,
+                                  args.tolerance, args.jobs)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.update_golden:
+        print(f'\nGolden images updated → {args.golden}')
+        return
+
+    if failures:
+        print(f'\n{len(failures)} regression(s):')
+        for design, folder, variant, diff in failures:
+            if diff is None:
+                print(f'  {design}/{folder}/{VARIANT_FILES[variant]}: golden missing')
+            else:
+                print(f"  {design}/{folder}/{VARIANT_FILES[variant]}: p99 ΔE {diff['p99']:.2f}, "
+                      f"max ΔE {diff['max']:.2f}, alpha {diff['alpha']:.0f}")
+        sys.exit(1)
+    print('\nNo visible changes against golden images')
+
+
+if __name__ == '__main__':
+    main()
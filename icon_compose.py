@@ -0,0 +1,108 @@
+"""
+아이콘 합성 모듈
+- 크기별로 캐시되는 안티앨리어싱 마스크 (원, 슈퍼타원, 둥근 사각형)
+- 프리멀티플라이드 알파 기반 NumPy 합성 (over, 마스크 적용)
+- 정사각형 렌더 한 장에서 round / squircle / legacy 변형을 바로 파생
+
+기존 스크립트의 create_round_icon은 호출마다 앨리어싱된 ellipse 마스크를 새로 그린 뒤
+paste + putalpha를 했다. 여기서는 마스크를 SDF 커버리지로 한 번만 만들고
+같은 크기에서는 재사용한다 (mdpi에서도 가장자리가 매끄러움).
+"""
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from icon_sdf import Circle, RoundedRect, Squircle, coverage
+
+# 마스크 모양 정의 (0~1 정규화 좌표)
+MASK_SHAPES = {
+    'circle': Circle(0.5, 0.5, 0.5),
+    'squircle': Squircle(0.5, 0.5, 0.5, n=5.0),
+    'rounded': RoundedRect(0.0, 0.0, 1.0, 1.0, 0.2),
+}
+
+# 정사각형 렌더에서 파생되는 변형 → 마스크
+DERIVED_VARIANTS = {
+    'round': 'circle',
+    'squircle': 'squircle',
+    'legacy': 'rounded',
+}
+
+
+@lru_cache(maxsize=None)
+def get_mask(name, size):
+    """name 모양의 size x size 커버리지 마스크 (0~1 float32, 읽기 전용, 크기별 캐시)"""
+    mask = coverage(MASK_SHAPES[name], size).astype(np.float32)
+    mask.flags.writeable = False
+    return mask
+
+
+def to_premultiplied(img):
+    """PIL RGBA 이미지 → 프리멀티플라이드 (H, W, 4) float32 배열 (0~1)"""
+    arr = np.asarray(img.convert('RGBA'), dtype=np.float32) / 255.0
+    arr[..., :3] *= arr[..., 3:4]
+    return arr
+
+
+def from_premultiplied(arr):
+    """프리멀티플라이드 float 배열 → PIL RGBA 이미지"""
+    alpha = arr[..., 3:4]
+    rgb = np.divide(arr[..., :3], alpha, out=np.zeros_like(arr[..., :3]), where=alpha > 0)
+    out = np.concatenate([np.clip(rgb, 0.0, 1.0), np.clip(alpha, 0.0, 1.0)], axis=-1)
+    return Image.fromarray(np.round(out * 255).astype(np.uint8), 'RGBA')
+
+
+def over(top, bottom):
+    """프리멀티플라이드 source-over 합성: top을 bottom 위에"""
+    return top + bottom * (1.0 - top[..., 3:4])
+
+
+def apply_mask(premult, mask):
+    """프리멀티플라이드 배열에 커버리지 마스크 적용 (모든 채널에 곱하면 됨)"""
+    return premult * mask[..., None]
+
+
+def mask_icon(img, name):
+    """정사각형 아이콘에 name 마스크를 적용한 새 이미지"""
+    mask = get_mask(name, img.size[0])
+    return from_premultiplied(apply_mask(to_premultiplied(img), mask))
+
+
+def create_round_icon(square_icon):
+    """정사각형 아이콘을 원형으로 만들기 (안티앨리어싱 마스크)"""
+    return mask_icon(square_icon, 'circle')
+
+
+def derive_variants(square_icon, variants):
+    """
+    정사각형 렌더 한 장에서 여러 변형 파생
+    프리멀티플라이드 변환은 한 번만 하고 마스크만 바꿔 곱한다
+    """
+    size = square_icon.size[0]
+    premult = None
+    results = {}
+
+    for variant in variants:
+        if variant == 'square':
+            results[variant] = square_icon
+            continue
+        if premult is None:
+            premult = to_premultiplied(square_icon)
+        mask = get_mask(DERIVED_VARIANTS[variant], size)
+        results[variant] = from_premultiplied(apply_mask(premult, mask))
+
+    return results
+
+
+def composite_layers(layers, size):
+    """
+    여러 RGBA 이미지를 아래→위 순서로 합성 (예: adaptive 배경 + foreground 미리보기)
+    크기가 다른 레이어는 size로 맞춘다
+    """
+    result = np.zeros((size, size, 4), dtype=np.float32)
+    for layer in layers:
+        if layer.size != (size, size):
+            layer = layer.resize((size, size), Image.Resampling.LANCZOS)
+        result = over(to_premultiplied(layer), result)
+    return from_premultiplied(result)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+아이콘 디자인 비교용 컨택트 시트
+- 디자인 × 변형을 행, 밀도를 열로 배치한 검토용 이미지 한 장 생성
+- 타일은 build_icons의 증분 캐시(build/icons + 매니페스트)에서 가져오고
+  없거나 오래된 타일만 다시 렌더링 → 디자인 하나를 고친 뒤에는 그 디자인만 렌더링
+- 투명 영역이 보이도록 체커보드 배경 위에 표시
+
+사용 예:
+    python icon_contact_sheet.py                      # 모든 디자인 → build/icons/contact-sheet.png
+    python icon_contact_sheet.py fresh v3 v4 --variant square --variant round
+"""
+import argparse
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from build_icons import (DEFAULT_OUTPUT_ROOT, DESIGNS, ICON_SIZES, VARIANT_FILES, build_icons,
+                         design_variants, output_path)
+
+DEFAULT_SHEET_PATH = os.path.join(DEFAULT_OUTPUT_ROOT, 'contact-sheet.png')
+
+PADDING = 16
+LABEL_WIDTH = 180
+HEADER_HEIGHT = 28
+CHECKER_SIZE = 8
+BACKGROUND = (245, 245, 245, 255)
+TEXT_COLOR = (40, 40, 40, 255)
+
+
+def checkerboard(size):
+    """투명도 확인용 체커보드 타일"""
+    img = Image.new('RGBA', (size, size), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for y in range(0, size, CHECKER_SIZE):
+        for x in range((y // CHECKER_SIZE % 2) * CHECKER_SIZE, size, CHECKER_SIZE * 2):
+            draw.rectangle([x, y, x + CHECKER_SIZE - 1, y + CHECKER_SIZE - 1], fill=(220, 220, 220, 255))
+    return img
+
+
+def sheet_rows(designs, variants=None):
+    """시트의 행 목록 [(design, variant)]"""
+    return [(design, variant) for design in designs for variant in design_variants(design)
+            if not variants or variant in variants]
+
+
+def render_sheet(designs, variants=None, densities=None, output_root=DEFAULT_OUTPUT_ROOT, workers=None):
+    """
+    캐시를 갱신(필요한 타일만 렌더링)한 뒤 컨택트 시트 이미지 생성
+    반환: (시트 Image, build_icons 통계)
+    """
+    stats = build_icons(designs, output_root, densities, variants, workers=workers)
+
+    folders = [folder for folder in ICON_SIZES if not densities or folder in densities]
+    rows = sheet_rows(designs, variants)
+    # 칸 크기 = 가장 큰 밀도의 아이콘 + 여백
+    cell = max(ICON_SIZES[folder] for folder in folders) + PADDING
+
+    width = LABEL_WIDTH + cell * len(folders) + PADDING
+    height = HEADER_HEIGHT + cell * len(rows) + PADDING
+
+    sheet = Image.new('RGBA', (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+    checkers = {}
+
+    for col, folder in enumerate(folders):
+        x = LABEL_WIDTH + col * cell
+        draw.text((x, PADDING // 2), f'{folder} ({ICON_SIZES[folder]})', fill=TEXT_COLOR, font=font)
+
+    y = HEADER_HEIGHT
+    for design, variant in rows:
+        draw.text((PADDING, y + cell // 2 - 6), f'{design} / {variant}', fill=TEXT_COLOR, font=font)
+
+        for col, folder in enumerate(folders):
+            size = ICON_SIZES[folder]
+            path = output_path(output_root, (design, folder, size, variant))
+            x = LABEL_WIDTH + col * cell
+            if size not in checkers:
+                checkers[size] = checkerboard(size)
+
+            tile = checkers[size].copy()
+            with Image.open(path) as icon:
+                tile.alpha_composite(icon.convert('RGBA'))
+            sheet.paste(tile, (x, y))
+
+        y += cell
+
+    return sheet, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아이콘 디자인 비교용 컨택트 시트')
+    parser.add_argument('designs', nargs='*', metavar='design',
+                        help=f'포함할 디자인 (기본: 전체) - {", ".join(DESIGNS)}')
+    parser.add_argument('--variant', action='append', choices=list(VARIANT_FILES),
+                        help='특정 변형만 포함 (반복 지정 가능)')
+    parser.add_argument('--density', action='append', choices=list(ICON_SIZES),
+                        help='특정 밀도만 포함 (반복 지정 가능)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='시트 PNG 경로 (기본: <캐시 루트>/contact-sheet.png)')
+    parser.add_argument('--cache-root', default=DEFAULT_OUTPUT_ROOT,
+                        help='build_icons 출력 루트 (타일 캐시)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='워커 프로세스 수')
+    args = parser.parse_args()
+
+    designs = args.designs or list(DESIGNS)
+    unknown = [d for d in designs if d not in DESIGNS]
+    if unknown:
+        parser.error(f'알 수 없는 디자인: {", ".join(unknown)}')
+
+    output = args.output or os.path.join(args.cache_root, os.path.basename(DEFAULT_SHEET_PATH))
+    sheet, stats = render_sheet(designs, args.variant, args.density, args.cache_root, args.jobs)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    sheet.save(output)
+    print(f'\nContact sheet saved → {output} ({sheet.size[0]}x{sheet.size[1]})')
+    print(f"renders {stats['rendered']}, tiles from cache {stats['skipped']}, "
+          f"re-rendered tiles {stats['written'] + stats['unchanged']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+아이콘 에셋 인코딩 단계
+- 무손실이 보장될 때만 팔레트(P) / RGB로 축소 (디코딩 결과가 원본과 완전히 같은지 검증)
+- 이미지마다 zlib 레벨 / 압축 전략(default, filtered, rle ...) 후보 중 가장 작은 결과 선택
+- 메타데이터 제거 (ICC, EXIF, 텍스트 청크)
+- PNG와 함께 WebP(무손실, 안드로이드 res 폴더 제외) / ICO(favicon) 출력
+- 파일 단위 프로세스 풀 병렬 처리 + 에셋별 절감 바이트 리포트
+
+APK와 웹 호스팅 번들 양쪽에 들어가는 아이콘이므로 바이트 단위로 줄인다.
+
+사용 예:
+    python icon_encode.py                        # public/icons + 안드로이드 mipmap 전체 재인코딩
+    python icon_encode.py --webp public/icons    # WebP도 함께 생성
+    python icon_encode.py --dry-run              # 쓰지 않고 절감량만 리포트
+"""
+import argparse
+import glob
+import io
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_TARGETS = [
+    os.path.join(BASE_DIR, 'public', 'icons'),
+    os.path.join(BASE_DIR, 'android', 'app', 'src', 'main', 'res', 'mipmap-*'),
+]
+
+# 시도할 (compress_level, zlib 전략) 후보
+# Pillow는 PNG 행 필터 종류를 직접 고르게 해주지 않으므로 zlib 쪽 전략을 고른다
+PNG_CANDIDATES = [
+    (9, zlib.Z_DEFAULT_STRATEGY),
+    (9, zlib.Z_FILTERED),
+    (9, zlib.Z_RLE),
+    (9, zlib.Z_HUFFMAN_ONLY),
+]
+
+# favicon.ico에 담을 크기 (원본보다 큰 크기는 제외)
+ICO_SIZES = [16, 32, 48]
+
+
+def strip_metadata(img):
+    """픽셀만 남긴 새 이미지 (info에 실린 ICC / EXIF / 텍스트가 다시 저장되지 않도록)"""
+    img = img.convert('RGBA')
+    return Image.frombytes('RGBA', img.size, img.tobytes())
+
+
+def reduced_modes(img):
+    """
+    무손실로 표현 가능한 더 작은 모드 후보들 (RGBA 원본 포함)
+    - 알파가 전부 255면 RGB
+    - 고유 색이 256개 이하면 팔레트 + tRNS
+    """
+    arr = np.asarray(img)
+    candidates = [('RGBA', img)]
+
+    if (arr[..., 3] == 255).all():
+        candidates.append(('RGB', img.convert('RGB')))
+
+    packed = arr.reshape(-1, 4).copy().view(np.uint32).ravel()
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) <= 256:
+        palette_rgba = colors.view(np.uint8).reshape(-1, 4)
+        palette_img = Image.fromarray(indices.astype(np.uint8).reshape(arr.shape[:2]), 'P')
+        palette_img.putpalette(palette_rgba[:, :3].tobytes())
+        if (palette_rgba[:, 3] < 255).any():
+            palette_img.info['transparency'] = palette_rgba[:, 3].tobytes()
+        candidates.append(('P', palette_img))
+
+    return candidates
+
+
+def _save_png(img, level, strategy):
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', compress_level=level, compress_type=strategy)
+    return buffer.getvalue()
+
+
+def _decodes_to(data, reference):
+    """인코딩 결과를 디코딩했을 때 reference(RGBA)와 픽셀이 완전히 같은지"""
+    decoded = Image.open(io.BytesIO(data)).convert('RGBA')
+    return decoded.tobytes() == reference.tobytes()
+
+
+def encode_png(img, verify=True):
+    """
+    가장 작은 무손실 PNG 인코딩 선택
+    반환: (PNG 바이트, 선택 정보 dict)
+    """
+    img = strip_metadata(img)
+    best = None
+
+    for mode, candidate in reduced_modes(img):
+        for level, strategy in PNG_CANDIDATES:
+            data = _save_png(candidate, level, strategy)
+            if best is None or len(data) < len(best[0]):
+                best = (data, {'mode': mode, 'level': level, 'strategy': strategy})
+
+    data, choice = best
+    if verify and choice['mode'] != 'RGBA' and not _decodes_to(data, img):
+        # 축소 모드가 무손실이 아니면 RGBA 후보 중 최선으로 되돌림
+        data, choice = min(
+            ((_save_png(img, level, strategy), {'mode': 'RGBA', 'level': level, 'strategy': strategy})
+             for level, strategy in PNG_CANDIDATES),
+            key=lambda item: len(item[0]),
+        )
+    return data, choice
+
+
+def encode_webp(img):
+    """무손실 WebP 인코딩"""
+    buffer = io.BytesIO()
+    strip_metadata(img).save(buffer, 'WEBP', lossless=True, quality=100, method=6)
+    return buffer.getvalue()
+
+
+def encode_ico(img):
+    """favicon.ico 인코딩 (원본 이하 크기만 포함)"""
+    size = img.size[0]
+    sizes = [(s, s) for s in ICO_SIZES if s <= size] or [(size, size)]
+    buffer = io.BytesIO()
+    strip_metadata(img).save(buffer, 'ICO', sizes=sizes)
+    return buffer.getvalue()
+
+
+def _same_content(path, data):
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _replace_atomically(path, writer):
+    """임시 파일에 writer(tmp_path)로 만든 뒤 교체 (하드링크된 다른 경로를 건드리지 않도록 항상 새 inode)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    writer(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def write_if_changed(path, data):
+    """내용이 다를 때만 파일 쓰기 (mtime 보존). 실제로 썼으면 True"""
+    if _same_content(path, data):
+        return False
+
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+
+    _replace_atomically(path, write)
+    return True
+
+
+def _reflink(src, dst):
+    """copy-on-write 복제 (Linux btrfs/xfs 등 FICLONE 지원 파일시스템)"""
+    import fcntl
+
+    FICLONE = 0x40049409
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def write_destinations(data, paths, link=True):
+    """
+    한 번 인코딩한 바이트를 여러 경로에 기록
+    첫 경로에 쓰고 나머지는 하드링크 → copy-on-write → 메모리의 바이트 쓰기 순으로 시도
+    (어떤 경우에도 파일을 다시 디코딩하지 않음). 경로별 결과 dict 반환
+    """
+    results = {}
+    source = None
+
+    for path in paths:
+        if _same_content(path, data):
+            results[path] = 'unchanged'
+            source = source or path
+            continue
+
+        if link and source is not None:
+            for method, linker in (('hardlink', os.link), ('reflink', _reflink)):
+                try:
+                    _replace_atomically(path, lambda tmp_path: linker(source, tmp_path))
+                    results[path] = method
+                    break
+                except (OSError, ImportError):
+                    continue
+            if path in results:
+                continue
+
+        write_if_changed(path, data)
+        results[path] = 'written'
+        source = source or path
+
+    return results
+
+
+def is_android_resource(path):
+    """안드로이드 res 폴더 안의 파일인지 (같은 이름의 png/webp가 공존하면 리소스 중복 빌드 에러)"""
+    folder = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return folder.startswith(('mipmap', 'drawable'))
+
+
+def encode_file(path, webp=False, ico=False, dry_run=False):
+    """PNG 파일 하나를 재인코딩 (원본보다 작을 때만 교체). 리포트 dict 반환"""
+    with open(path, 'rb') as f:
+        original = f.read()
+
+    img = Image.open(io.BytesIO(original))
+    data, choice = encode_png(img)
+
+    report = {
+        'path': path,
+        'before': len(original),
+        'after': min(len(data), len(original)),
+        'choice': choice,
+        'extra': {},
+    }
+
+    if not dry_run and len(data) < len(original):
+        write_if_changed(path, data)
+
+    stem = os.path.splitext(path)[0]
+    if webp and not is_android_resource(path):
+        webp_data = encode_webp(img)
+        report['extra'][stem + '.webp'] = len(webp_data)
+        if not dry_run:
+            write_if_changed(stem + '.webp', webp_data)
+
+    if ico and os.path.basename(stem) == 'favicon':
+        ico_data = encode_ico(img)
+        report['extra'][stem + '.ico'] = len(ico_data)
+        if not dry_run:
+            write_if_changed(stem + '.ico', ico_data)
+
+    return report
+
+
+def collect_pngs(targets):
+    """파일 / 디렉토리 / glob 패턴 → PNG 경로 목록"""
+    paths = []
+    for target in targets:
+        for match in sorted(glob.glob(target)) or [target]:
+            if os.path.isdir(match):
+                paths += sorted(glob.glob(os.path.join(match, '*.png')))
+            elif match.lower().endswith('.png') and os.path.exists(match):
+                paths.append(match)
+    return paths
+
+
+def _encode_file_job(args):
+    return encode_file(*args)
+
+
+def encode_assets(paths, webp=False, ico=True, dry_run=False, workers=None):
+    """여러 파일을 프로세스 풀로 병렬 재인코딩. 리포트 목록 반환"""
+    jobs = [(path, webp, ico, dry_run) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_encode_file_job, jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아이콘 PNG/WebP/ICO 인코딩 최적화')
+    parser.add_argument('targets', nargs='*', help='PNG 파일 / 디렉토리 / glob (기본: 웹 아이콘 + 안드로이드 mipmap)')
+    parser.add_argument('--webp', action='store_true', help='PNG 옆에 무손실 WebP 생성')
+    parser.add_argument('--no-ico', action='store_true', help='favicon.png에서 favicon.ico를 만들지 않음')
+    parser.add_argument('--dry-run', action='store_true', help='파일을 쓰지 않고 리포트만 출력')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='워커 프로세스 수')
+    args = parser.parse_args()
+
+    paths = collect_pngs(args.targets or DEFAULT_TARGETS)
+    if not paths:
+        print('No PNG files found')
+        return
+
+    reports = encode_assets(paths, args.webp, not args.no_ico, args.dry_run, args.jobs)
+
+    total_before = total_after = 0
+    for report in reports:
+        before, after = report['before'], report['after']
+        total_before += before
+        total_after += after
+        choice = report['choice']
+        rel_path = os.path.relpath(report['path'], BASE_DIR)
+        print(f"{rel_path}: {before:,} → {after:,} bytes (-{before - after:,}) "
+              f"[{choice['mode']}, level {choice['level']}, strategy {choice['strategy']}]")
+        for extra_path, size in report['extra'].items():
+            print(f"    + {os.path.relpath(extra_path, BASE_DIR)} ({size:,} bytes)")
+
+    saved = total_before - total_after
+    percent = saved / total_before * 100 if total_before else 0
+    print(f"\nTotal: {total_before:,} → {total_after:,} bytes, saved {saved:,} ({percent:.1f}%)"
+          f"{' (dry run)' if args.dry_run else ''}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+아이콘용 폰트 서비스
+- 시스템 폰트 디렉토리를 한 번 스캔해 디스크에 캐시하는 탐색 인덱스 (fontconfig 방식)
+  파일명 / 패밀리 / 스타일 이름으로 찾기. 폰트 디렉토리 mtime이 바뀌면 다시 스캔
+- (경로, 크기)별 로드된 FreeTypeFont 캐시
+- (텍스트, 경로, 크기)별 렌더링된 글리프 마스크 + bbox 캐시
+
+텍스트 기반 아이콘이 밀도마다 os.path.exists → truetype → textbbox를 반복하지 않도록 한다.
+
+사용 예:
+    path = find_font(('arial', 'segoeui', 'helvetica', 'dejavusans-bold'))
+    mask, bbox = glyph_mask('S', path, 115)
+    img.paste((255, 255, 255, 255), (x + bbox[0], y + bbox[1]), mask)
+"""
+import json
+import os
+import sys
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(BASE_DIR, 'build', 'font-index.json')
+
+# 인덱스 형식이 바뀌면 올림
+INDEX_VERSION = 1
+
+FONT_EXTENSIONS = ('.ttf', '.ttc', '.otf')
+
+
+def font_dirs():
+    """플랫폼별 시스템 / 사용자 폰트 디렉토리"""
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        windir = os.environ.get('WINDIR', 'C:/Windows')
+        dirs = [
+            os.path.join(windir, 'Fonts'),
+            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'),
+        ]
+    elif sys.platform == 'darwin':
+        dirs = [
+            '/System/Library/Fonts',
+            '/Library/Fonts',
+            os.path.join(home, 'Library', 'Fonts'),
+        ]
+    else:
+        dirs = [
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+            os.path.join(home, '.fonts'),
+            os.path.join(home, '.local', 'share', 'fonts'),
+        ]
+    # 프로젝트에 포함된 폰트도 탐색
+    dirs.append(os.path.join(BASE_DIR, 'public', 'fonts'))
+    return [d for d in dirs if d and os.path.isdir(d)]
+
+
+def _scan_dirs(dirs):
+    """폰트 디렉토리 트리 → (디렉토리 mtime dict, 폰트 파일 목록)"""
+    mtimes = {}
+    files = []
+    for root_dir in dirs:
+        for folder, _, names in os.walk(root_dir):
+            mtimes[folder] = os.stat(folder).st_mtime
+            files += [os.path.join(folder, name) for name in names
+                      if name.lower().endswith(FONT_EXTENSIONS)]
+    return mtimes, sorted(files)
+
+
+def _font_names(path):
+    """폰트 파일의 (패밀리, 스타일) 이름. 읽을 수 없으면 None"""
+    try:
+        family, style = ImageFont.truetype(path, 12).getname()
+        return family, style
+    except OSError:
+        return None
+
+
+def build_index(dirs=None):
+    """폰트 디렉토리를 스캔해 인덱스 생성"""
+    dirs = dirs if dirs is not None else font_dirs()
+    mtimes, files = _scan_dirs(dirs)
+
+    fonts = {}
+    for path in files:
+        names = _font_names(path)
+        if names is None:
+            continue
+        family, style = names
+        fonts[path] = {
+            'stem': os.path.splitext(os.path.basename(path))[0].lower(),
+            'family': (family or '').lower(),
+            'style': (style or '').lower(),
+        }
+
+    return {'version': INDEX_VERSION, 'dirs': mtimes, 'fonts': fonts}
+
+
+def _index_is_fresh(index):
+    """인덱스를 만든 뒤 폰트 디렉토리가 바뀌지 않았는지 (stat만 수행)"""
+    if index.get('version') != INDEX_VERSION:
+        return False
+    roots = font_dirs()
+    if sorted(roots) != sorted(d for d in index['dirs'] if d in roots):
+        return False
+    for folder, mtime in index['dirs'].items():
+        try:
+            if os.stat(folder).st_mtime != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def load_index(index_path=INDEX_PATH):
+    """디스크 캐시된 인덱스 로드 (없거나 오래됐으면 다시 스캔 후 저장)"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if _index_is_fresh(index):
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = build_index()
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass
+    return index
+
+
+@lru_cache(maxsize=None)
+def find_font(candidates):
+    """
+    후보 이름 중 처음으로 찾은 폰트 경로 (없으면 None)
+    후보는 파일명(확장자 제외) 또는 '패밀리' / '패밀리 스타일' (대소문자 무시)
+    """
+    if isinstance(candidates, str):
+        candidates = (candidates,)
+    fonts = load_index()['fonts']
+
+    for candidate in candidates:
+        wanted = candidate.lower()
+        for path, info in fonts.items():
+            full_name = f"{info['family']} {info['style']}"
+            if wanted in (info['stem'], info['family'], full_name):
+                return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_font(path, size):
+    """(경로, 크기)별 FreeTypeFont 캐시. path가 None이면 Pillow 기본 폰트"""
+    if path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=1024)
+def glyph_mask(text, path, size):
+    """
+    렌더링된 텍스트 마스크 캐시
+    반환: (L 모드 마스크, draw.textbbox((0, 0), text)와 같은 bbox)
+    마스크의 (0, 0)은 bbox 왼쪽 위에 해당 → 그릴 때 (x + bbox[0], y + bbox[1])에 붙인다
+    """
+    font = get_font(path, size)
+    bbox = font.getbbox(text)
+    width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    mask = Image.new('L', (max(width, 1), max(height, 1)), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+    return mask, bbox
@@ -0,0 +1,213 @@
+"""
+SDF 도형 설명 → Android VectorDrawable / adaptive-icon XML 변환
+- 래스터 아이콘과 같은 icon_sdf 레이어 목록을 path 데이터로 옮긴다
+- 단색 채우기는 fillColor, RadialGradient는 aapt:attr <gradient type="radial">
+- adaptive icon: drawable-v24/ic_launcher_foreground.xml, drawable-v24/ic_launcher_background.xml,
+  mipmap-anydpi-v26/ic_launcher(_round).xml, values/ic_launcher_background.xml
+
+벡터로 adaptive icon을 구성하면 PNG는 API 26 미만용 ic_launcher / ic_launcher_round만 필요하다.
+
+제약:
+- Union은 자식마다 같은 채우기의 <path>를 따로 낸다 (반투명 채우기는 겹친 부분이 두 번 칠해짐)
+- Subtract는 evenOdd 채우기로 표현하므로 cutter가 base 안에 있어야 정확하다
+- Squircle은 다각형으로 근사한다
+"""
+import math
+import os
+from xml.sax.saxutils import quoteattr
+
+from icon_sdf import (ArcStroke, Circle, Polygon, RadialGradient, RoundedRect, Segment, Squircle,
+                      Subtract, Union)
+
+# adaptive icon 레이어 뷰포트 (108dp, 가운데 72dp가 보이는 영역)
+ADAPTIVE_VIEWPORT = 108
+
+SQUIRCLE_SEGMENTS = 64
+
+
+def _num(value):
+    """경로 숫자 포맷 (소수점 3자리, 불필요한 0 제거)"""
+    text = f'{value:.3f}'.rstrip('0').rstrip('.')
+    return '0' if text in ('', '-0') else text
+
+
+def color_hex(color):
+    """(r, g, b, a) → #AARRGGBB"""
+    r, g, b, a = (list(color) + [255])[:4]
+    return f'#{int(a):02X}{int(r):02X}{int(g):02X}{int(b):02X}'
+
+
+def _circle_path(cx, cy, r):
+    return (f'M{_num(cx - r)},{_num(cy)}'
+            f'a{_num(r)},{_num(r)} 0 1,0 {_num(2 * r)},0'
+            f'a{_num(r)},{_num(r)} 0 1,0 {_num(-2 * r)},0Z')
+
+
+def _rounded_rect_path(x0, y0, x1, y1, radius):
+    r = min(radius, (x1 - x0) / 2, (y1 - y0) / 2)
+    if r <= 0:
+        return f'M{_num(x0)},{_num(y0)}H{_num(x1)}V{_num(y1)}H{_num(x0)}Z'
+    n = _num(r)
+    return (f'M{_num(x0 + r)},{_num(y0)}H{_num(x1 - r)}'
+            f'A{n},{n} 0 0,1 {_num(x1)},{_num(y0 + r)}V{_num(y1 - r)}'
+            f'A{n},{n} 0 0,1 {_num(x1 - r)},{_num(y1)}H{_num(x0 + r)}'
+            f'A{n},{n} 0 0,1 {_num(x0)},{_num(y1 - r)}V{_num(y0 + r)}'
+            f'A{n},{n} 0 0,1 {_num(x0 + r)},{_num(y0)}Z')
+
+
+def _polygon_path(points):
+    head, *rest = points
+    return (f'M{_num(head[0])},{_num(head[1])}'
+            + ''.join(f'L{_num(x)},{_num(y)}' for x, y in rest) + 'Z')
+
+
+def _squircle_points(shape, scale):
+    points = []
+    for i in range(SQUIRCLE_SEGMENTS):
+        t = 2 * math.pi * i / SQUIRCLE_SEGMENTS
+        c, s = math.cos(t), math.sin(t)
+        x = math.copysign(abs(c) ** (2 / shape.n), c) * shape.r
+        y = math.copysign(abs(s) ** (2 / shape.n), s) * shape.r
+        points.append(((shape.cx + x) * scale, (shape.cy + y) * scale))
+    return points
+
+
+def shape_paths(shape, scale):
+    """
+    도형 → [(pathData, 속성 dict)] 목록
+    속성: kind('fill' / 'stroke'), strokeWidth, fillType
+    """
+    if isinstance(shape, Circle):
+        return [(_circle_path(shape.cx * scale, shape.cy * scale, shape.r * scale), {'kind': 'fill'})]
+
+    if isinstance(shape, RoundedRect):
+        path = _rounded_rect_path(shape.x0 * scale, shape.y0 * scale, shape.x1 * scale, shape.y1 * scale,
+                                  shape.radius * scale)
+        return [(path, {'kind': 'fill'})]
+
+    if isinstance(shape, Polygon):
+        return [(_polygon_path([(x * scale, y * scale) for x, y in shape.points]), {'kind': 'fill'})]
+
+    if isinstance(shape, Squircle):
+        return [(_polygon_path(_squircle_points(shape, scale)), {'kind': 'fill'})]
+
+    if isinstance(shape, Segment):
+        path = f'M{_num(shape.x0 * scale)},{_num(shape.y0 * scale)}L{_num(shape.x1 * scale)},{_num(shape.y1 * scale)}'
+        return [(path, {'kind': 'stroke', 'strokeWidth': shape.width * scale})]
+
+    if isinstance(shape, ArcStroke):
+        sx, sy = shape._endpoint(shape.start)
+        ex, ey = shape._endpoint(shape.end)
+        sweep = (shape.end - shape.start) % 360 or 360
+        r = _num(shape.r * scale)
+        if sweep >= 360:
+            path = _circle_path(shape.cx * scale, shape.cy * scale, shape.r * scale)
+        else:
+            large = 1 if sweep > 180 else 0
+            path = (f'M{_num(sx * scale)},{_num(sy * scale)}'
+                    f'A{r},{r} 0 {large},1 {_num(ex * scale)},{_num(ey * scale)}')
+        return [(path, {'kind': 'stroke', 'strokeWidth': shape.width * scale})]
+
+    if isinstance(shape, Union):
+        paths = []
+        for child in shape.shapes:
+            paths += shape_paths(child, scale)
+        return paths
+
+    if isinstance(shape, Subtract):
+        base = shape_paths(shape.base, scale)
+        cutter = shape_paths(shape.cutter, scale)
+        if all(attrs['kind'] == 'fill' for _, attrs in base + cutter):
+            data = ''.join(path for path, _ in base + cutter)
+            return [(data, {'kind': 'fill', 'fillType': 'evenOdd'})]
+        raise ValueError('Subtract는 채우기 도형끼리만 벡터로 변환할 수 있습니다')
+
+    raise TypeError(f'벡터로 변환할 수 없는 도형: {type(shape).__name__}')
+
+
+def _gradient_xml(fill, scale, indent):
+    pad = ' ' * indent
+    items = ''.join(
+        f'{pad}        <item android:offset={quoteattr(_num(offset))} android:color="{color_hex(color)}" />\n'
+        for offset, color in fill.stops
+    )
+    return (f'{pad}<aapt:attr name="android:{{attr}}">\n'
+            f'{pad}    <gradient\n'
+            f'{pad}        android:type="radial"\n'
+            f'{pad}        android:centerX="{_num(fill.cx * scale)}"\n'
+            f'{pad}        android:centerY="{_num(fill.cy * scale)}"\n'
+            f'{pad}        android:gradientRadius="{_num(fill.radius * scale)}">\n'
+            f'{items}'
+            f'{pad}    </gradient>\n'
+            f'{pad}</aapt:attr>\n')
+
+
+def _path_xml(path, attrs, fill, scale):
+    color_attr = 'strokeColor' if attrs['kind'] == 'stroke' else 'fillColor'
+    lines = [f'    <path\n        android:pathData={quoteattr(path)}']
+    if attrs.get('fillType'):
+        lines.append(f'        android:fillType="{attrs["fillType"]}"')
+    if attrs['kind'] == 'stroke':
+        lines.append(f'        android:strokeWidth="{_num(attrs["strokeWidth"])}"')
+        lines.append('        android:strokeLineCap="round"')
+
+    if isinstance(fill, RadialGradient):
+        gradient = _gradient_xml(fill, scale, 8).replace('{attr}', color_attr)
+        return '\n'.join(lines) + '>\n' + gradient + '    </path>\n'
+
+    lines.append(f'        android:{color_attr}="{color_hex(fill)}"')
+    return '\n'.join(lines) + ' />\n'
+
+
+def vector_drawable(layers, viewport=ADAPTIVE_VIEWPORT, size_dp=ADAPTIVE_VIEWPORT):
+    """(도형, 채우기) 레이어 목록 → VectorDrawable XML 문자열"""
+    body = ''
+    for shape, fill in layers:
+        for path, attrs in shape_paths(shape, viewport):
+            body += _path_xml(path, attrs, fill, viewport)
+
+    return ('<?xml version="1.0" encoding="utf-8"?>\n'
+            '<vector xmlns:android="http://schemas.android.com/apk/res/android"\n'
+            '    xmlns:aapt="http://schemas.android.com/aapt"\n'
+            f'    android:width="{size_dp}dp"\n'
+            f'    android:height="{size_dp}dp"\n'
+            f'    android:viewportWidth="{viewport}"\n'
+            f'    android:viewportHeight="{viewport}">\n'
+            f'{body}'
+            '</vector>\n')
+
+
+ADAPTIVE_ICON_XML = '''<?xml version="1.0" encoding="utf-8"?>
+<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
+    <background android:drawable="@drawable/ic_launcher_background"/>
+    <foreground android:drawable="@drawable/ic_launcher_foreground"/>
+</adaptive-icon>
+'''
+
+BACKGROUND_COLOR_XML = '''<?xml version="1.0" encoding="utf-8"?>
+<resources>
+    <color name="ic_launcher_background">{color}</color>
+</resources>
+'''
+
+
+def adaptive_icon_files(background_fill, foreground_layers):
+    """
+    adaptive icon 리소스 파일 내용 {res 기준 상대 경로: XML}
+    background_fill: 배경 전체를 채울 단색 또는 RadialGradient (0~1 좌표)
+    """
+    background_layers = [(RoundedRect(0, 0, 1, 1), background_fill)]
+    if isinstance(background_fill, RadialGradient):
+        # 단색 폴백은 그라데이션의 안쪽 색
+        solid = background_fill.stops[0][1]
+    else:
+        solid = background_fill
+
+    rgb = '#{:02x}{:02x}{:02x}'.format(*solid[:3])
+    return {
+        os.path.join('drawable-v24', 'ic_launcher_foreground.xml'): vector_drawable(foreground_layers),
+        os.path.join('drawable-v24', 'ic_launcher_background.xml'): vector_drawable(background_layers),
+        os.path.join('mipmap-anydpi-v26', 'ic_launcher.xml'): ADAPTIVE_ICON_XML,
+        os.path.join('mipmap-anydpi-v26', 'ic_launcher_round.xml'): ADAPTIVE_ICON_XML,
+        os.path.join('values', 'ic_launcher_background.xml'): BACKGROUND_COLOR_XML.format(color=rgb),
+    }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ID 기반 운세 CSV 패치 엔진
+행 ID(H_AQ_130 등)로 키워드/내용 교정을 한 번에 적용
+
+- 패치 파일: 세미콜론 CSV, 헤더 ID;Keyword;Content (빈 칸은 기존 값 유지)
+- 대상 CSV마다 한 번 읽고 한 번 쓰기 (패치 개수와 무관), 바뀐 파일만 다시 씀
+- 이미 같은 값이면 건너뜀 → 여러 번 실행해도 결과 동일
+- 어느 대상 파일에도 없는 ID는 따로 보고
+- 같은 ID를 서로 다른 값으로 고치는 패치 파일끼리의 충돌은 오류
+
+사용법:
+    python patch_fortune_csv.py fixes.csv                          # public/fortune_data/*.csv 전체에 적용
+    python patch_fortune_csv.py fixes.csv more.csv --target public/fortune_data/horoscope.csv --dry-run
+"""
+
+import argparse
+import glob
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FORTUNE_DATA_DIR = os.path.join(BASE_DIR, 'public', 'fortune_data')
+PATCH_FIELDS = ['Keyword', 'Content']
+
+
+class PatchError(Exception):
+    """잘못된 패치 파일 또는 패치 간 충돌"""
+
+
+def _check_value(value, where):
+    if ';' in value or '\n' in value or '\r' in value:
+        raise PatchError(f"{where}: 값에 ';' 또는 줄바꿈이 들어갈 수 없습니다")
+    return value
+
+
+def load_patches(paths):
+    """패치 파일들 → {ID: {'Keyword': ..., 'Content': ...}} (빈 칸은 제외)"""
+    patches = {}
+    sources = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            header = f.readline().rstrip('\r\n').split(';')
+            if 'ID' not in header or not set(PATCH_FIELDS) & set(header):
+                raise PatchError(f"{path}: 헤더에 ID와 Keyword/Content 열이 필요합니다 ({';'.join(header)})")
+            for line_number, line in enumerate(f, start=2):
+                line = line.rstrip('\r\n')
+                if not line.strip():
+                    continue
+                values = line.split(';')
+                if len(values) != len(header):
+                    raise PatchError(f"{path}:{line_number}: 열 {len(header)}개가 필요한데 {len(values)}개입니다")
+                row = dict(zip(header, values))
+                patch = {field: row[field] for field in PATCH_FIELDS if row.get(field)}
+                add_patch(patches, sources, row['ID'], patch, f"{path}:{line_number}")
+    return patches
+
+
+def add_patch(patches, sources, row_id, patch, where):
+    """patches에 한 건 추가 (같은 ID에 다른 값이면 PatchError)"""
+    for field, value in patch.items():
+        _check_value(value, where)
+        previous = patches.get(row_id, {}).get(field)
+        if previous is not None and previous != value:
+            raise PatchError(f"{where}: {row_id} {field} 충돌 ({sources[row_id, field]}와 다름)")
+        patches.setdefault(row_id, {})[field] = value
+        sources[row_id, field] = where
+
+
+def _patched_lines(src, csv_path, patches, applied, unchanged):
+    """src 줄을 패치해 차례로 내보냄 (applied/unchanged에 ID 기록)"""
+    header_line = src.readline()
+    header = header_line.rstrip('\r\n').split(';')
+    if 'ID' not in header:
+        raise PatchError(f"{csv_path}: ID 열이 없습니다")
+    id_index = header.index('ID')
+    field_index = {field: header.index(field) for field in PATCH_FIELDS if field in header}
+    yield header_line
+
+    for line in src:
+        body = line.rstrip('\r\n')
+        values = body.split(';')
+        patch = patches.get(values[id_index]) if len(values) == len(header) else None
+        if patch is None:
+            yield line
+            continue
+
+        row_id = values[id_index]
+        for field, value in patch.items():
+            if field in field_index:
+                values[field_index[field]] = value
+        new_body = ';'.join(values)
+        if new_body == body:
+            unchanged.add(row_id)
+        else:
+            applied.add(row_id)
+        # 원래 줄바꿈 문자 유지
+        yield new_body + line[len(body):]
+
+
+def apply_patches(csv_path, patches, dry_run=False):
+    """
+    CSV 한 파일에 패치를 한 번의 순차 처리로 적용 (dry_run이면 임시 파일 없이 세기만 함)
+    반환: (적용된 ID set, 이미 같은 값이라 건너뛴 ID set)
+    """
+    applied = set()
+    unchanged = set()
+
+    if dry_run:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as src:
+            for _ in _patched_lines(src, csv_path, patches, applied, unchanged):
+                pass
+        return applied, unchanged
+
+    tmp_path = csv_path + '.tmp'
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as src, \
+                open(tmp_path, 'w', encoding='utf-8', newline='') as dst:
+            dst.writelines(_patched_lines(src, csv_path, patches, applied, unchanged))
+        if applied:
+            os.replace(tmp_path, csv_path)
+    finally:
+        # 바뀐 것이 없거나 도중에 실패하면 임시 파일 정리
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return applied, unchanged
+
+
+def patch_files(targets, patches, dry_run=False):
+    """
+    여러 CSV에 적용
+    반환: ({파일: (적용 ID, 건너뛴 ID)}, 어느 파일에도 없는 ID 목록)
+    """
+    results = {}
+    matched = set()
+    for path in targets:
+        applied, unchanged = apply_patches(path, patches, dry_run)
+        results[path] = (applied, unchanged)
+        matched |= applied | unchanged
+    return results, sorted(set(patches) - matched)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='행 ID 기준으로 운세 CSV 교정을 한 번에 적용')
+    parser.add_argument('patches', nargs='+', help='패치 파일 (ID;Keyword;Content)')
+    parser.add_argument('--target', nargs='+', default=None,
+                        help='대상 CSV (기본: public/fortune_data/*.csv)')
+    parser.add_argument('--dry-run', action='store_true', help='파일은 바꾸지 않고 결과만 출력')
+    args = parser.parse_args()
+
+    try:
+        patches = load_patches(args.patches)
+    except PatchError as e:
+        raise SystemExit(f"❌ {e}")
+
+    targets = args.target or sorted(glob.glob(os.path.join(FORTUNE_DATA_DIR, '*.csv')))
+    try:
+        results, unmatched = patch_files(targets, patches, args.dry_run)
+    except PatchError as e:
+        raise SystemExit(f"❌ {e}")
+
+    for path, (applied, unchanged) in results.items():
+        if applied or unchanged:
+            print(f"{'(dry-run) ' if args.dry_run else ''}{os.path.basename(path)}: "
+                  f"{len(applied)}건 수정, {len(unchanged)}건 이미 적용됨")
+    print(f"패치 {len(patches)}건, 대상 파일 {len(targets)}개")
+    if unmatched:
+        print(f"⚠️ 어느 파일에도 없는 ID {len(unmatched)}건: {', '.join(unmatched)}")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
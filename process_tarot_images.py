@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Responsive Tarot Card Image Pipeline
+Turns the raw Wikimedia scans into display-sized variants for the app
+
+- Crops every card to one uniform aspect ratio (median of the deck by default)
+- Produces several display widths as progressive JPEG and WebP
+- Content-hashed file names (cache forever, change name on change)
+- manifest.json maps each source image (e.g. major_00.jpg) to its variants and sizes
+- Cards are processed in parallel by a process pool; unchanged cards are skipped
+
+Usage:
+    python process_tarot_images.py                     # public/images/tarot (or the archive) → responsive/
+    python process_tarot_images.py --widths 240 480 --source archive/tarot-images/tarot
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image, ImageOps
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_TAROT_DIR = os.path.join(BASE_DIR, 'public', 'images', 'tarot')
+ARCHIVE_TAROT_DIR = os.path.join(BASE_DIR, 'archive', 'tarot-images', 'tarot')
+DEFAULT_OUTPUT_DIR = os.path.join(PUBLIC_TAROT_DIR, 'responsive')
+MANIFEST_NAME = 'manifest.json'
+
+# 카드 목록 / 상세 / 확대 보기용 표시 너비
+DEFAULT_WIDTHS = [160, 320, 480, 720]
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+# method 6은 5보다 2배 이상 느리고 2% 정도만 작아짐
+WEBP_METHOD = 5
+
+# 파이프라인 출력이 바뀌면 올려서 모든 카드를 다시 처리
+PIPELINE_VERSION = 1
+
+
+def default_source_dir():
+    """public/images/tarot if the deck was downloaded there, otherwise the archive copy"""
+    if glob.glob(os.path.join(PUBLIC_TAROT_DIR, '*.jpg')):
+        return PUBLIC_TAROT_DIR
+    return ARCHIVE_TAROT_DIR
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def deck_aspect(paths):
+    """Median width / height of the deck (reads only the image headers)"""
+    ratios = []
+    for path in paths:
+        with Image.open(path) as img:
+            ratios.append(img.width / img.height)
+    return round(statistics.median(ratios), 4)
+
+
+def hashed_name(stem, width, data, ext):
+    """major_00.320.1a2b3c4d5e.jpg"""
+    return f"{stem}.{width}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+
+
+def encode_jpeg(img):
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def encode_webp(img):
+    buffer = io.BytesIO()
+    img.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+    return buffer.getvalue()
+
+
+def process_card(path, output_dir, aspect, widths):
+    """
+    Crop one card to `aspect` and write every width as JPEG + WebP.
+    Returns the manifest entry for the card
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+
+    with Image.open(path) as img:
+        # JPEG DCT 스케일링으로 필요한 크기 근처까지만 디코딩
+        largest = max(widths)
+        img.draft('RGB', (largest, round(largest / aspect)))
+        img = img.convert('RGB')
+
+        # 원본보다 큰 목표 너비는 만들지 않고, 대신 원본 너비를 가장 큰 변형으로 둔다
+        usable = [w for w in widths if w <= img.width]
+        if max(widths) > img.width:
+            usable.append(img.width)
+        base = ImageOps.fit(img, (max(usable), round(max(usable) / aspect)),
+                            Image.Resampling.LANCZOS, centering=(0.5, 0.5))
+
+    variants = []
+    for width in sorted(usable, reverse=True):
+        height = round(width / aspect)
+        resized = base if base.width == width else base.resize((width, height), Image.Resampling.LANCZOS)
+
+        variant = {'width': width, 'height': height}
+        for fmt, encoder, ext in (('jpeg', encode_jpeg, 'jpg'), ('webp', encode_webp, 'webp')):
+            data = encoder(resized)
+            name = hashed_name(stem, width, data, ext)
+            target = os.path.join(output_dir, name)
+            if not os.path.exists(target):
+                tmp_path = target + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, target)
+            variant[fmt] = name
+            variant[f'{fmt}_bytes'] = len(data)
+        variants.append(variant)
+
+    return {
+        'source_sha256': file_sha256(path),
+        'source_bytes': os.path.getsize(path),
+        'variants': sorted(variants, key=lambda v: v['width']),
+    }
+
+
+def _card_job(args):
+    path, output_dir, aspect, widths = args
+    return os.path.basename(path), process_card(path, output_dir, aspect, widths)
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_up_to_date(entry, path, output_dir):
+    """A card can be skipped if its source hash matches and all variant files exist"""
+    if not entry or entry.get('source_sha256') != file_sha256(path):
+        return False
+    return all(os.path.exists(os.path.join(output_dir, variant[fmt]))
+               for variant in entry['variants'] for fmt in ('jpeg', 'webp'))
+
+
+def process_deck(source_dir=None, output_dir=DEFAULT_OUTPUT_DIR, widths=DEFAULT_WIDTHS,
+                 aspect=None, workers=None):
+    """Process every card in `source_dir`. Returns the manifest dict"""
+    source_dir = source_dir or default_source_dir()
+    paths = sorted(glob.glob(os.path.join(source_dir, '*.jpg')))
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    aspect = aspect or deck_aspect(paths)
+    widths = sorted(set(widths))
+    params = {'version': PIPELINE_VERSION, 'aspect': aspect, 'widths': widths,
+              'jpeg_quality': JPEG_QUALITY, 'webp_quality': WEBP_QUALITY, 'webp_method': WEBP_METHOD}
+
+    cards = previous.get('cards', {}) if previous.get('params') == params else {}
+    todo = [path for path in paths
+            if not is_up_to_date(cards.get(os.path.basename(path)), path, output_dir)]
+
+    print(f"Processing {len(todo)}/{len(paths)} tarot cards from {source_dir}")
+    print(f"Aspect {aspect}, widths {widths}\n")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_card_job, (path, output_dir, aspect, widths)) for path in todo]
+        for future in as_completed(futures):
+            name, entry = future.result()
+            cards[name] = entry
+            sizes = ', '.join(f"{v['width']}w {v['jpeg_bytes'] // 1024}K/{v['webp_bytes'] // 1024}K"
+                              for v in entry['variants'])
+            print(f"OK {name} ({entry['source_bytes'] // 1024}K) → {sizes}")
+
+    names = {os.path.basename(path) for path in paths}
+    manifest = {
+        'params': params,
+        'cards': {name: cards[name] for name in sorted(cards) if name in names},
+    }
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    # 매니페스트에 없는 예전 해시 파일 정리
+    referenced = {variant[fmt] for entry in manifest['cards'].values()
+                  for variant in entry['variants'] for fmt in ('jpeg', 'webp')}
+    for path in glob.glob(os.path.join(output_dir, '*.*.*.*')):
+        if os.path.basename(path) not in referenced and path.endswith(('.jpg', '.webp')):
+            os.remove(path)
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build responsive tarot card variants')
+    parser.add_argument('--source', default=None,
+                        help='Directory with the raw card JPEGs (default: public/images/tarot or the archive)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--widths', type=int, nargs='+', default=DEFAULT_WIDTHS, help='Display widths in pixels')
+    parser.add_argument('--aspect', type=float, default=None,
+                        help='Width / height of every output (default: median of the deck)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    source_dir = args.source or default_source_dir()
+    if not glob.glob(os.path.join(source_dir, '*.jpg')):
+        # 빈 폴더로 돌리면 매니페스트와 기존 변형 파일이 모두 지워짐
+        raise SystemExit(f'No tarot JPEG files found in {source_dir}')
+
+    manifest = process_deck(source_dir, args.output, args.widths, args.aspect, args.jobs)
+
+    cards = manifest['cards'].values()
+    source_total = sum(entry['source_bytes'] for entry in cards)
+    smallest = sum(entry['variants'][0]['webp_bytes'] for entry in cards)
+    print(f"\n{len(manifest['cards'])} cards: originals {source_total / 1024 / 1024:.1f} MB, "
+          f"smallest WebP set {smallest / 1024:.0f} KB → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+운세 문구 용어 검사/치환기 (Aho-Corasick)
+규칙 목록을 하나의 오토마톤으로 만들어 운세 데이터 전체를 파일당 한 번씩만 훑음
+
+- 규칙 파일: 세미콜론 CSV, 헤더 Term;Replacement;Scope
+  - Replacement가 비어 있으면 금지어 (보고만 함)
+  - Scope: 쉼표로 구분한 카테고리 (CSV의 Category 열, JSON의 최상위 키). 비어 있으면 전체
+- 대상: public/fortune_data/*.csv, src/utils/fortune.csv, fortune_database.json
+  - CSV는 Keyword/Content 열, JSON은 문자열 값만 검사 (JSON 서식은 그대로 유지)
+  - 보고는 행 ID 기준으로 묶음 (horoscope_<sign>.csv 사본의 같은 행은 한 건)
+- 겹치는 후보는 가장 왼쪽 → 가장 긴 용어 우선
+- 영문/숫자 용어(AI, NFT 등)는 앞뒤가 영문/숫자가 아닐 때만 일치 (PAID의 AI 제외)
+- 파일 단위로 프로세스 풀에서 병렬 처리
+
+사용법:
+    python rewrite_fortune_terms.py                        # fortune_terms.csv 규칙으로 검사만
+    python rewrite_fortune_terms.py --apply                # 치환 규칙 적용 (금지어는 계속 보고)
+    python rewrite_fortune_terms.py --rules my_rules.csv public/fortune_data/horoscope_leo.csv
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FORTUNE_DATA_DIR = os.path.join(BASE_DIR, 'public', 'fortune_data')
+DEFAULT_RULES_PATH = os.path.join(BASE_DIR, 'fortune_terms.csv')
+CSV_TEXT_FIELDS = ['Keyword', 'Content']
+
+# JSON 문자열 리터럴과 구조 문자
+JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]')
+
+
+def default_targets():
+    return (sorted(glob.glob(os.path.join(FORTUNE_DATA_DIR, '*.csv')))
+            + [os.path.join(BASE_DIR, 'src', 'utils', 'fortune.csv'),
+               os.path.join(FORTUNE_DATA_DIR, 'fortune_database.json')])
+
+
+def load_rules(path):
+    """규칙 파일 → [(term, replacement 또는 None, scope frozenset 또는 None)]"""
+    rules = []
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        header = f.readline().rstrip('\r\n').split(';')
+        if header[:2] != ['Term', 'Replacement']:
+            raise ValueError(f"{path}: 헤더는 Term;Replacement;Scope 여야 합니다")
+        for line_number, line in enumerate(f, start=2):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            values = line.split(';') + ['']
+            term, replacement, scope = values[0], values[1], values[2]
+            if not term:
+                raise ValueError(f"{path}:{line_number}: Term이 비어 있습니다")
+            scope = frozenset(s.strip() for s in scope.split(',') if s.strip()) or None
+            rules.append((term, replacement or None, scope))
+    return rules
+
+
+class TermAutomaton:
+    """Aho-Corasick 오토마톤: 텍스트 한 번 순회로 모든 용어의 출현 위치를 찾음"""
+
+    def __init__(self, terms):
+        self.terms = list(terms)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, term in enumerate(self.terms):
+            state = 0
+            for ch in term:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.output[state].append(index)
+
+        # 실패 링크: 너비 우선으로 가장 긴 접미사 상태 연결
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def finditer(self, text):
+        """(start, term index) 를 끝 위치 순서로 생성"""
+        goto, fail, output, terms = self.goto, self.fail, self.output, self.terms
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in output[state]:
+                yield i - len(terms[index]) + 1, index
+
+
+def _is_word_char(ch):
+    return ch.isascii() and ch.isalnum()
+
+
+class TermRewriter:
+    """규칙 목록 → 스코프/경계 검사를 포함한 검색·치환"""
+
+    def __init__(self, rules):
+        self.rules_by_term = {}
+        for rule in rules:
+            self.rules_by_term.setdefault(rule[0], []).append(rule)
+        self.automaton = TermAutomaton(self.rules_by_term)
+
+    def _rule_for(self, term, category):
+        # 카테고리 지정 규칙이 전체 규칙보다 우선
+        candidates = [r for r in self.rules_by_term[term] if r[2] is None or category in r[2]]
+        return min(candidates, key=lambda r: r[2] is None, default=None)
+
+    def matches(self, text, category):
+        """겹치지 않는 일치 [(start, end, rule)] (가장 왼쪽, 같으면 가장 긴 용어)"""
+        found = []
+        for start, index in self.automaton.finditer(text):
+            term = self.automaton.terms[index]
+            end = start + len(term)
+            if _is_word_char(term[0]) and start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if _is_word_char(term[-1]) and end < len(text) and _is_word_char(text[end]):
+                continue
+            rule = self._rule_for(term, category)
+            if rule:
+                found.append((start, end, rule))
+
+        found.sort(key=lambda m: (m[0], -m[1]))
+        selected = []
+        for match in found:
+            if not selected or match[0] >= selected[-1][1]:
+                selected.append(match)
+        return selected
+
+    def rewrite(self, text, category):
+        """(치환된 텍스트, 일치 목록)"""
+        found = self.matches(text, category)
+        parts = []
+        position = 0
+        for start, end, (term, replacement, _) in found:
+            if replacement is not None:
+                parts.append(text[position:start])
+                parts.append(replacement)
+                position = end
+        parts.append(text[position:])
+        return ''.join(parts), found
+
+
+def csv_segments(text):
+    """CSV 텍스트 → (start, end, category, 위치 설명, 값) — Keyword/Content 칸"""
+    lines = text.splitlines(keepends=True)
+    header = lines[0].rstrip('\r\n').split(';')
+    columns = [header.index(field) for field in CSV_TEXT_FIELDS if field in header]
+    category_column = header.index('Category') if 'Category' in header else None
+    id_column = header.index('ID') if 'ID' in header else None
+
+    offset = len(lines[0])
+    for line_number, line in enumerate(lines[1:], start=2):
+        values = line.rstrip('\r\n').split(';')
+        if len(values) == len(header):
+            starts = [0]
+            for value in values:
+                starts.append(starts[-1] + len(value) + 1)
+            category = values[category_column] if category_column is not None else None
+            label = f"{line_number}:{values[id_column]}" if id_column is not None else str(line_number)
+            for column in columns:
+                start = offset + starts[column]
+                yield start, start + len(values[column]), category, label, values[column]
+        offset += len(line)
+
+
+def json_segments(text):
+    """JSON 텍스트 → 문자열 값 칸 (category = 최상위 키)"""
+    depth = 0
+    top_key = None
+    pending = None
+    line_number = 1
+    last = 0
+    for token in JSON_TOKEN.finditer(text):
+        value = token.group()
+        if value.startswith('"'):
+            pending = token
+            continue
+        if value == ':':
+            # 직전 문자열은 값이 아니라 키
+            if depth == 1:
+                top_key = json.loads(pending.group())
+        elif pending is not None:
+            line_number += text.count('\n', last, pending.start())
+            last = pending.start()
+            yield pending.start(), pending.end(), top_key, str(line_number), json.loads(pending.group())
+        pending = None
+        if value in '{[':
+            depth += 1
+        elif value in '}]':
+            depth -= 1
+
+
+_REWRITER = None
+
+
+def _init_worker(rules):
+    global _REWRITER
+    _REWRITER = TermRewriter(rules)
+
+
+def process_file(args):
+    """프로세스 풀 작업: (path, apply) → (path, [(위치, category, term, replacement)], 변경 여부)"""
+    path, apply = args
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    is_json = path.endswith('.json')
+    segments = json_segments(text) if is_json else csv_segments(text)
+
+    report = []
+    parts = []
+    position = 0
+    for start, end, category, label, value in segments:
+        new_value, found = _REWRITER.rewrite(value, category)
+        for _, _, (term, replacement, _) in found:
+            report.append((label, category, term, replacement))
+        if new_value != value:
+            parts.append(text[position:start])
+            parts.append(json.dumps(new_value, ensure_ascii=False) if is_json else new_value)
+            position = end
+
+    changed = bool(parts)
+    if changed and apply:
+        parts.append(text[position:])
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(''.join(parts))
+        os.replace(tmp_path, path)
+    return path, report, changed
+
+
+def scan_corpus(paths, rules, apply=False, workers=None):
+    """모든 파일 병렬 처리 → [(path, report, changed)]"""
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules,)) as pool:
+        return list(pool.map(process_file, [(path, apply) for path in paths]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aho-Corasick 기반 운세 문구 용어 검사/치환')
+    parser.add_argument('files', nargs='*', help='대상 파일 (기본: 운세 데이터 전체)')
+    parser.add_argument('--rules', default=DEFAULT_RULES_PATH, help='규칙 파일 (Term;Replacement;Scope)')
+    parser.add_argument('--apply', action='store_true', help='치환 규칙을 파일에 적용')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='작업 프로세스 수')
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules)
+    paths = [path for path in (args.files or default_targets()) if os.path.exists(path)]
+    results = scan_corpus(paths, rules, args.apply, args.jobs)
+
+    # horoscope_<sign>.csv는 horoscope.csv의 사본 → 같은 행 ID의 같은 용어는 한 건으로 셈
+    findings = {}
+    saved = []
+    for path, report, changed in results:
+        name = os.path.relpath(path, BASE_DIR)
+        for label, category, term, replacement in report:
+            row = label.split(':', 1)[1] if ':' in label else f"{name}:{label}"
+            finding = findings.setdefault((row, term), {'where': f"{name}:{label}", 'category': category,
+                                                        'replacement': replacement, 'hits': Counter()})
+            finding['hits'][name] += 1
+        if changed and args.apply:
+            saved.append(name)
+
+    banned = 0
+    replaced = 0
+    for (_, term), finding in findings.items():
+        # 사본이 원본과 어긋났을 수 있으므로 파일별 횟수 중 최대값으로 셈
+        counts = finding['hits']
+        hits = max(counts.values())
+        extra = [f"{hits}회"] if hits > 1 else []
+        if len(counts) > 1:
+            extra.append(f"사본 {len(counts) - 1}개 포함")
+        if len(set(counts.values())) > 1:
+            extra.append('파일별 ' + ', '.join(f"{os.path.basename(name)} {count}회" for name, count in counts.items()))
+        suffix = f" ({', '.join(extra)})" if extra else ''
+        if finding['replacement'] is None:
+            banned += hits
+            print(f"⛔ {finding['where']} [{finding['category']}] {term}{suffix}")
+        else:
+            replaced += hits
+            print(f"{'✅' if args.apply else '✏️'} {finding['where']} [{finding['category']}] "
+                  f"{term} → {finding['replacement']}{suffix}")
+    for name in saved:
+        print(f"   {name} 저장")
+
+    print(f"\n규칙 {len(rules)}개, 파일 {len(paths)}개, 행 {len({row for row, _ in findings})}개: 치환 {replaced}건"
+          f"{'' if args.apply else ' (미적용)'}, 금지어 {banned}건")
+    if banned or (replaced and not args.apply):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
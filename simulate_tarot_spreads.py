@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tarot Spread Simulator
+Draws millions of spreads with vectorized NumPy permutations to check (and benchmark)
+how fair a draw algorithm is
+
+- Spreads: single card (1), three-card (3), Celtic cross (10), all drawn without replacement
+- Orientation per drawn card (upright = odd ID, reversed = the following even ID in Tarot.csv)
+- Draw algorithms:
+    permutation   argsort of random keys per spread (uniform reference)
+    lcg-shuffle   the app's seededShuffle: Fisher-Yates driven by SeededRandom
+                  (seed * 9301 + 49297) % 233280, seeded with calculateCosmicEnergy of a random day
+- Orientation models:
+    iid           every drawn card is reversed independently with --reversed-rate (idealized)
+    app           the app's calculateReversed: (birth date * 17 + day of month * 23 + minutes * 7 + hour * 11) % 100
+                  below the threshold, from a random birth date and moment; one orientation for the whole spread
+- Reports per-card, per-position, per-orientation and card x orientation frequencies
+  with chi-square goodness-of-fit p-values, plus spreads/second
+- Spreads are processed in batches, so memory stays flat for any --spreads
+
+Usage:
+    python simulate_tarot_spreads.py                               # 1M spreads of each type, all algorithms/models
+    python simulate_tarot_spreads.py --spreads 5000000 --spread celtic --algorithm permutation --detail
+"""
+
+import argparse
+import datetime
+import math
+import time
+
+import numpy as np
+
+from compile_tarot_data import CARD_COUNT, TarotDataError, read_rows
+
+SPREADS = {'single': 1, 'three': 3, 'celtic': 10}
+DEFAULT_SPREADS = 1_000_000
+BATCH_SIZE = 100_000
+# 앱의 calculateReversed 기준값 (해시 % 100 < 40)
+DEFAULT_REVERSED_RATE = 0.4
+# app 모델의 생년월일 범위
+BIRTH_YEARS = (1940, 2010)
+# 이 값보다 작은 p-value는 불공정 의심
+ALPHA = 0.001
+
+LCG_A, LCG_C, LCG_M = 9301, 49297, 233280
+
+
+def deck_names():
+    """Card names in Tarot.csv order (upright = odd-ID rows); the card images are not needed"""
+    rows, problems = read_rows()
+    names = [row['Keyword'] for _, row in rows if row['ID'][1:].isdigit() and int(row['ID'][1:]) % 2 == 1]
+    if len(names) != CARD_COUNT:
+        problems.append(f"expected {CARD_COUNT} upright cards, found {len(names)}")
+    if problems:
+        for problem in problems:
+            print(f"ERROR {problem}")
+        raise SystemExit(f"\n{TarotDataError(problems)}")
+    return names
+
+
+def draw_permutation(rng, n, deck_size, k):
+    """(n, k) card indices: k smallest of deck_size random keys per row, in key order"""
+    keys = rng.random((n, deck_size), dtype=np.float32)
+    if k < deck_size:
+        top = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(deck_size), (n, deck_size))
+    order = np.argsort(np.take_along_axis(keys, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def cosmic_seeds(rng, n, year):
+    """calculateCosmicEnergy for n random days of `year` (dayOfYear * 100 + moon * 10 + weekday)"""
+    days = 366 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 365
+    day_of_year = rng.integers(1, days + 1, size=n)
+    # JS getDay(): 일요일 = 0
+    first_weekday = datetime.date(year, 1, 1).isoweekday() % 7
+    weekday = (day_of_year - 1 + first_weekday) % 7
+    return day_of_year * 100 + (day_of_year % 29) * 10 + weekday
+
+
+def draw_lcg_shuffle(rng, n, deck_size, k, year=None):
+    """The app's seededShuffle, vectorized across spreads (one Python step per deck position)"""
+    seed = cosmic_seeds(rng, n, year or datetime.date.today().year).astype(np.int64)
+    deck = np.tile(np.arange(deck_size), (n, 1))
+    rows = np.arange(n)
+    for i in range(deck_size - 1, 0, -1):
+        seed = (seed * LCG_A + LCG_C) % LCG_M
+        j = (seed * (i + 1)) // LCG_M
+        deck[rows, i], deck[rows, j] = deck[rows, j], deck[rows, i].copy()
+    return deck[:, :k]
+
+
+ALGORITHMS = {
+    'permutation': draw_permutation,
+    'lcg-shuffle': draw_lcg_shuffle,
+}
+
+
+def orient_iid(rng, n, k, reversed_rate):
+    """(n, k) reversed mask: each card flips its own biased coin"""
+    return rng.random((n, k)) < reversed_rate
+
+
+def _random_dates(rng, n, first, last):
+    """(year, month, day) arrays of n uniform dates in [first, last]"""
+    days = rng.integers(np.datetime64(first, 'D').astype(np.int64),
+                        np.datetime64(last, 'D').astype(np.int64) + 1, size=n).astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (days - months).astype(np.int64) + 1
+    return year, month, day
+
+
+def orient_app(rng, n, k, reversed_rate, year=None):
+    """(n, 1) reversed mask from the app's calculateReversed for a random user and moment (whole spread)"""
+    year = year or datetime.date.today().year
+    birth_year, birth_month, birth_day = _random_dates(rng, n, f'{BIRTH_YEARS[0]}-01-01', f'{BIRTH_YEARS[1]}-12-31')
+    _, _, current_day = _random_dates(rng, n, f'{year}-01-01', f'{year}-12-31')
+    hour = rng.integers(0, 24, size=n)
+    minute = rng.integers(0, 60, size=n)
+
+    user_seed = birth_year * 10000 + birth_month * 100 + birth_day
+    reversed_hash = (user_seed * 17 + current_day * 23 + (hour * 60 + minute) * 7 + hour * 11) % 100
+    # 앱은 40 고정, 여기서는 --reversed-rate를 같은 방식의 기준값으로 사용
+    return (reversed_hash < round(reversed_rate * 100))[:, None]
+
+
+ORIENTATIONS = {
+    'iid': orient_iid,
+    'app': orient_app,
+}
+
+
+def chi2_sf(stat, df):
+    """Chi-square survival function (Wilson-Hilferty normal approximation)"""
+    if df <= 0:
+        return 1.0
+    z = ((stat / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def chi2_test(observed, expected):
+    """(statistic, p-value) for observed counts against expected counts (same shape)"""
+    observed = np.asarray(observed, dtype=np.float64).ravel()
+    expected = np.asarray(expected, dtype=np.float64).ravel()
+    stat = float(((observed - expected) ** 2 / expected).sum())
+    return stat, chi2_sf(stat, observed.size - 1)
+
+
+def simulate(algorithm, spread_size, spreads, deck_size, reversed_rate, seed=None, batch_size=BATCH_SIZE,
+             orientation='iid'):
+    """
+    Run `spreads` draws and count outcomes.
+    Returns {'position_counts': (k, deck) array, 'reversed_counts': (k, deck) array, 'seconds': float,
+             'orientation_unit': cards sharing one orientation (1, or k for a spread-wide model)}
+    """
+    rng = np.random.default_rng(seed)
+    draw = ALGORITHMS[algorithm]
+    orient = ORIENTATIONS[orientation]
+    unit = 1
+    cells = spread_size * deck_size
+    position_counts = np.zeros(cells, dtype=np.int64)
+    reversed_counts = np.zeros(cells, dtype=np.int64)
+    # (위치, 카드) 쌍을 한 번의 bincount로 집계하기 위한 오프셋
+    offsets = np.arange(spread_size) * deck_size
+
+    start = time.perf_counter()
+    done = 0
+    while done < spreads:
+        n = min(batch_size, spreads - done)
+        cells_drawn = (draw(rng, n, deck_size, spread_size) + offsets).ravel()
+        reversed_mask = orient(rng, n, spread_size, reversed_rate)
+        unit = spread_size // reversed_mask.shape[1]
+        reversed_mask = np.broadcast_to(reversed_mask, (n, spread_size)).ravel()
+        position_counts += np.bincount(cells_drawn, minlength=cells)
+        reversed_counts += np.bincount(cells_drawn[reversed_mask], minlength=cells)
+        done += n
+    seconds = time.perf_counter() - start
+
+    return {
+        'position_counts': position_counts.reshape(spread_size, deck_size),
+        'reversed_counts': reversed_counts.reshape(spread_size, deck_size),
+        'seconds': seconds,
+        'orientation_unit': unit,
+    }
+
+
+def analyze(result, spreads, reversed_rate):
+    """Chi-square checks of a simulate() result"""
+    positions = result['position_counts']
+    reversed_ = result['reversed_counts'].sum(axis=0)
+    spread_size, deck_size = positions.shape
+    cards = positions.sum(axis=0)
+    draws = spreads * spread_size
+    expected_card = draws / deck_size
+
+    # 스프레드 전체가 같은 방향이면 카드가 아니라 스프레드 단위로 검정 (독립 시행 수)
+    unit = result['orientation_unit']
+    trials = draws // unit
+    reversed_trials = reversed_.sum() // unit
+    orientation = np.array([trials - reversed_trials, reversed_trials])
+    card_orientation = np.stack([cards - reversed_, reversed_])
+    return {
+        'card': chi2_test(cards, np.full(deck_size, expected_card)),
+        # 위치마다 따로 검정, 가장 나쁜 위치를 보고
+        'position': min((chi2_test(row, np.full(deck_size, spreads / deck_size)) for row in positions),
+                        key=lambda test: test[1]),
+        'orientation': chi2_test(orientation, [trials * (1 - reversed_rate), trials * reversed_rate]),
+        'card_orientation': chi2_test(card_orientation, np.outer([1 - reversed_rate, reversed_rate],
+                                                                 np.full(deck_size, expected_card))),
+        'max_deviation': float(np.abs(cards / expected_card - 1).max()),
+        'distinct_cards': int((cards > 0).sum()),
+    }
+
+
+def print_detail(result, names, reversed_rate):
+    cards = result['position_counts'].sum(axis=0)
+    reversed_ = result['reversed_counts'].sum(axis=0)
+    expected = cards.sum() / len(cards)
+    print(f"   {'card':<12} {'draws':>10} {'vs expected':>12} {'reversed':>9}")
+    for index in np.argsort(cards):
+        rate = reversed_[index] / cards[index] if cards[index] else 0.0
+        print(f"   {names[index]:<12} {cards[index]:>10,} {cards[index] / expected - 1:>+11.2%} "
+              f"{rate:>8.1%}{'' if abs(rate - reversed_rate) < 0.05 else ' !'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate tarot spreads and check draw fairness')
+    parser.add_argument('--spreads', type=int, default=DEFAULT_SPREADS, help='Spreads per spread type')
+    parser.add_argument('--spread', choices=sorted(SPREADS), nargs='+', default=list(SPREADS),
+                        help='Spread types to simulate')
+    parser.add_argument('--algorithm', choices=sorted(ALGORITHMS), nargs='+', default=list(ALGORITHMS),
+                        help='Draw algorithms to compare')
+    parser.add_argument('--orientation', choices=sorted(ORIENTATIONS), nargs='+', default=list(ORIENTATIONS),
+                        help='Orientation models: iid coin flip per card, or the app\'s calculateReversed per spread')
+    parser.add_argument('--reversed-rate', type=float, default=DEFAULT_REVERSED_RATE,
+                        help='Reversed probability (iid) or hash threshold / 100 (app); default 0.4, the app\'s threshold')
+    parser.add_argument('--seed', type=int, default=None, help='NumPy RNG seed (reproducible runs)')
+    parser.add_argument('--detail', action='store_true', help='Print per-card frequencies')
+    args = parser.parse_args()
+
+    names = deck_names()
+    print(f"Deck: {len(names)} cards, {args.spreads:,} spreads per run, "
+          f"reversed rate {args.reversed_rate:.0%}, alpha {ALPHA}\n")
+
+    unfair = []
+    for algorithm in args.algorithm:
+        for orientation in args.orientation:
+            for spread in args.spread:
+                result = simulate(algorithm, SPREADS[spread], args.spreads, len(names), args.reversed_rate,
+                                  args.seed, orientation=orientation)
+                checks = analyze(result, args.spreads, args.reversed_rate)
+
+                failed = [name for name in ('card', 'position', 'orientation', 'card_orientation')
+                          if checks[name][1] < ALPHA]
+                if failed:
+                    unfair.append(f"{algorithm}/{orientation}/{spread}")
+                print(f"{algorithm:<12} {orientation:<4} {spread:<7} "
+                      f"{args.spreads / result['seconds']:>12,.0f} spreads/s  "
+                      f"p(card)={checks['card'][1]:.3g}  p(worst position)={checks['position'][1]:.3g}  "
+                      f"p(orientation)={checks['orientation'][1]:.3g}  "
+                      f"p(card x orientation)={checks['card_orientation'][1]:.3g}  "
+                      f"max dev {checks['max_deviation']:.2%}  {'FAIL ' + ','.join(failed) if failed else 'ok'}")
+                if args.detail:
+                    print_detail(result, names, args.reversed_rate)
+
+    if unfair:
+        raise SystemExit(f"\nNot uniform at alpha {ALPHA}: {', '.join(unfair)}")
+    print('\nAll draws consistent with a uniform deck')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tarot Image Content-Addressed Store
+Hashes every tarot card copy, flags wrong / duplicate cards and deduplicates identical files
+
+- SHA-256 + 64-bit perceptual hash (DCT pHash, NumPy) per file, computed in parallel
+- Flags: identical bytes under different card names, near-duplicate cards (pHash Hamming
+  distance), copies of the same card that disagree between directories, and TAROT_IMAGES
+  URLs whose Wikimedia path shard (/a/ab/ = MD5 of the file name) does not match
+- Blob store (build/tarot-store by default): blobs/<sha[:2]>/<sha>.jpg + index.json (path → sha256, sha256 → size / phash)
+- --dedupe replaces the scanned files with hardlinks to their blob, so both copies of the
+  deck share the same bytes on disk
+
+Usage:
+    python tarot_image_store.py                     # scan public/images/tarot + archive, report, fill the store
+    python tarot_image_store.py --dedupe            # also hardlink the copies to the blobs
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+import numpy as np
+from PIL import Image
+
+from download_tarot import TAROT_IMAGES
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIRS = [
+    os.path.join(BASE_DIR, 'public', 'images', 'tarot'),
+    os.path.join(BASE_DIR, 'archive', 'tarot-images', 'tarot'),
+]
+DEFAULT_STORE_DIR = os.path.join(BASE_DIR, 'build', 'tarot-store')
+INDEX_NAME = 'index.json'
+
+# pHash 해밍 거리가 이 값 이하이면 같은 그림으로 의심 (서로 다른 카드끼리는 최소 10)
+DEFAULT_NEAR_THRESHOLD = 6
+
+PHASH_SIZE = 32
+PHASH_BITS = 8
+
+
+def _dct_matrix(n):
+    """Orthonormal DCT-II matrix (n x n)"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+DCT = _dct_matrix(PHASH_SIZE)
+
+
+def phash(img):
+    """64-bit DCT perceptual hash: low-frequency 8x8 coefficients above their median"""
+    img.draft('L', (PHASH_SIZE * 2, PHASH_SIZE * 2))
+    gray = np.asarray(img.convert('L').resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.BOX), dtype=np.float64)
+    low = (DCT @ gray @ DCT.T)[:PHASH_BITS, :PHASH_BITS].ravel()
+    # DC 성분은 밝기 전체라 중앙값 계산에서 제외
+    bits = low > np.median(low[1:])
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def hash_file(path):
+    """Process-pool job: path → (path, sha256, size, phash)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    with Image.open(path) as img:
+        perceptual = phash(img)
+    return path, hashlib.sha256(data).hexdigest(), len(data), perceptual
+
+
+def hamming_matrix(hashes):
+    """Pairwise Hamming distances of 64-bit hashes (vectorized XOR + popcount)"""
+    values = np.array(hashes, dtype=np.uint64)
+    xor = values[:, None] ^ values[None, :]
+    return np.unpackbits(xor.view(np.uint8).reshape(len(values), len(values), 8), axis=-1).sum(axis=-1)
+
+
+def url_shard_problems(images=TAROT_IMAGES):
+    """TAROT_IMAGES entries whose /x/xy/ path shard is not the MD5 of the file name"""
+    problems = []
+    for name, url in images.items():
+        parts = urlsplit(url).path.split('/')
+        digest = hashlib.md5(unquote(parts[-1]).encode('utf-8')).hexdigest()
+        if parts[-3] != digest[0] or parts[-2] != digest[:2]:
+            problems.append((name, url, f'{digest[0]}/{digest[:2]}'))
+    return problems
+
+
+def _rel(path):
+    return os.path.relpath(path, BASE_DIR)
+
+
+def card_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def find_problems(records, threshold=DEFAULT_NEAR_THRESHOLD):
+    """
+    records: [(path, sha256, size, phash)]
+    Returns {'identical': [...], 'near': [...], 'disagree': [...]} lists of path groups / pairs
+    """
+    problems = {'identical': [], 'near': [], 'disagree': []}
+
+    by_sha = {}
+    by_card = {}
+    for path, sha, _, _ in records:
+        by_sha.setdefault(sha, []).append(path)
+        by_card.setdefault(card_name(path), set()).add(sha)
+
+    # 같은 바이트인데 카드 이름이 다름 → 한쪽이 잘못된 카드
+    for sha, paths in by_sha.items():
+        if len({card_name(p) for p in paths}) > 1:
+            problems['identical'].append(sorted(paths))
+
+    # 같은 카드의 사본끼리 내용이 다름
+    for name, shas in by_card.items():
+        if len(shas) > 1:
+            problems['disagree'].append(sorted(p for p, s, _, _ in records if card_name(p) == name))
+
+    # 카드 이름이 다른데 그림이 거의 같음 (대표 사본 하나씩만 비교)
+    first = {}
+    for record in records:
+        first.setdefault(card_name(record[0]), record)
+    cards = list(first.values())
+    distances = hamming_matrix([record[3] for record in cards])
+    for i, j in zip(*np.nonzero(np.triu(distances <= threshold, k=1))):
+        a, b = cards[i], cards[j]
+        if a[1] != b[1]:
+            problems['near'].append((a[0], b[0], int(distances[i, j])))
+
+    return problems
+
+
+def ingest(records, store_dir, dedupe=False):
+    """
+    Put every distinct file into blobs/ and write the index.
+    dedupe: replace the scanned file with a hardlink to its blob. Returns bytes saved on disk
+    """
+    blob_dir = os.path.join(store_dir, 'blobs')
+    index = {'files': {}, 'blobs': {}}
+    saved = 0
+
+    for path, sha, size, perceptual in records:
+        blob = os.path.join(blob_dir, sha[:2], f'{sha}.jpg')
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            tmp_path = blob + '.tmp'
+            try:
+                os.link(path, tmp_path)
+            except OSError:
+                with open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                    dst.write(src.read())
+            os.replace(tmp_path, blob)
+
+        if dedupe and not os.path.samefile(path, blob):
+            tmp_path = path + '.tmp'
+            try:
+                os.link(blob, tmp_path)
+                os.replace(tmp_path, path)
+                saved += size
+            except OSError:
+                # 다른 파일시스템이면 하드링크 불가 → 그대로 둠
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        index['files'][os.path.relpath(path, BASE_DIR).replace(os.sep, '/')] = sha
+        index['blobs'][sha] = {'size': size, 'phash': f'{perceptual:016x}'}
+
+    index['files'] = dict(sorted(index['files'].items()))
+    index['blobs'] = dict(sorted(index['blobs'].items()))
+    tmp_path = os.path.join(store_dir, INDEX_NAME + '.tmp')
+    os.makedirs(store_dir, exist_ok=True)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1)
+    os.replace(tmp_path, os.path.join(store_dir, INDEX_NAME))
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Content-addressed tarot image store with duplicate detection')
+    parser.add_argument('dirs', nargs='*', help='Directories to scan (default: public/images/tarot + archive copy)')
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help='Blob store directory (default: build/tarot-store)')
+    parser.add_argument('--dedupe', action='store_true', help='Replace scanned files with hardlinks to their blob')
+    parser.add_argument('--threshold', type=int, default=DEFAULT_NEAR_THRESHOLD,
+                        help='pHash Hamming distance treated as near-duplicate')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    dirs = [d for d in (args.dirs or DEFAULT_DIRS) if os.path.isdir(d)]
+    paths = sorted(p for d in dirs for p in glob.glob(os.path.join(d, '*.jpg')))
+    if not paths:
+        print('No tarot images found')
+        return
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        records = list(pool.map(hash_file, paths, chunksize=8))
+
+    problems = find_problems(records, args.threshold)
+    shards = url_shard_problems()
+    saved = ingest(records, args.store, args.dedupe)
+
+    print(f"Scanned {len(records)} files in {len(dirs)} director{'y' if len(dirs) == 1 else 'ies'}, "
+          f"{len({r[1] for r in records})} distinct blobs → {args.store}")
+    for group in problems['identical']:
+        print(f"IDENTICAL  {', '.join(map(_rel, group))}")
+    for a, b, distance in problems['near']:
+        print(f"NEAR ({distance:2d})  {_rel(a)} ~ {_rel(b)}")
+    for group in problems['disagree']:
+        print(f"DISAGREE   {', '.join(map(_rel, group))}")
+    for name, url, expected in shards:
+        print(f"URL SHARD  {name}: {url} (file name hashes to /{expected}/)")
+    if args.dedupe:
+        print(f"Deduplicated {saved / 1024 / 1024:.1f} MB via hardlinks")
+
+    if any(problems.values()) or shards:
+        raise SystemExit(1)
+    print('No duplicate or suspicious cards')
+
+
+if __name__ == '__main__':
+    main()
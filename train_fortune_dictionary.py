@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+운세 문구 압축 사전 학습기
+운세 텍스트에 반복되는 구절("…하는 날입니다", "당신의 …", 별자리 이름 등)로
+공유 압축 사전을 만들고, 문구 하나 / 샤드 하나 단위 압축률을 일반 gzip과 비교
+
+- 학습 대상: horoscope.csv, src/utils/fortune.csv (Keyword/Content), fortune_database.json (문자열 값)
+- 어절 n-gram 빈도로 후보 구절을 뽑고 (반복 횟수 - 1) × 바이트 길이 점수 순으로 최대 32 KB까지 채움
+  (점수 높은 구절을 사전 끝에 두어 deflate 거리 코드를 짧게)
+- 사전은 앞뒤 헤더 없는 원시 바이트 → zlib zdict로 쓰고, 나중에 zstd raw-content 사전으로도 그대로 사용 가능
+- 평가: 학습에서 뺀 문구(--holdout 비율)를 따로 압축해 과적합 없는 수치도 보고
+- 출력: 내용 해시 이름의 사전 파일 + dictionary.json (파일명, 크기, 형식)
+
+사용법:
+    python train_fortune_dictionary.py                       # → build/fortune-dict/
+    python train_fortune_dictionary.py --size 16384 --holdout 0.2 -o public/fortune_data/shards
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from collections import Counter
+
+from build_fortune_shards import (FORTUNE_CSV_PATH, HOROSCOPE_CSV_PATH, fortune_shards, horoscope_shards,
+                                  read_csv, shard_payload)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATABASE_JSON_PATH = os.path.join(BASE_DIR, 'public', 'fortune_data', 'fortune_database.json')
+# 앱이 아직 사전을 쓰지 않으므로 public/ 밖 (배포/프리캐시 대상 아님)
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'build', 'fortune-dict')
+META_NAME = 'dictionary.json'
+
+# deflate 창 크기가 32 KB라 그보다 큰 사전은 앞부분이 쓰이지 않음
+DEFAULT_DICT_SIZE = 32 * 1024
+DEFAULT_HOLDOUT = 0.1
+MAX_NGRAM = 6
+MIN_COUNT = 3
+
+
+def corpus_entries():
+    """(키, 텍스트) 목록: CSV 행마다 'Keyword;Content', JSON 문자열 값마다 하나"""
+    entries = []
+    for path in (HOROSCOPE_CSV_PATH, FORTUNE_CSV_PATH):
+        for row in read_csv(path):
+            entries.append((row['ID'], f"{row['Keyword']};{row['Content']}"))
+
+    def walk(value, key):
+        if isinstance(value, str):
+            entries.append((key, value))
+        elif isinstance(value, dict):
+            for child_key, child in value.items():
+                walk(child, f"{key}/{child_key}")
+        elif isinstance(value, list):
+            for i, child in enumerate(value):
+                walk(child, f"{key}[{i}]")
+
+    with open(DATABASE_JSON_PATH, 'r', encoding='utf-8') as f:
+        walk(json.load(f), 'db')
+    return entries
+
+
+def is_holdout(key, ratio):
+    """키 해시로 고정된 평가용 분할 (실행마다 같은 문구가 빠짐)"""
+    return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF < ratio
+
+
+def train_dictionary(texts, size=DEFAULT_DICT_SIZE, max_ngram=MAX_NGRAM, min_count=MIN_COUNT):
+    """반복 구절로 원시 사전 바이트 생성"""
+    counts = Counter()
+    for text in texts:
+        words = text.split()
+        for n in range(1, max_ngram + 1):
+            for i in range(len(words) - n + 1):
+                counts[' '.join(words[i:i + n])] += 1
+
+    scored = []
+    for phrase, count in counts.items():
+        length = len(phrase.encode('utf-8'))
+        if count >= min_count and length >= 4:
+            scored.append(((count - 1) * length, phrase))
+    scored.sort(reverse=True)
+
+    chosen = []
+    used = 0
+    for _, phrase in scored:
+        # 이미 고른 긴 구절에 포함된 구절은 중복
+        if any(phrase in longer for longer in chosen):
+            continue
+        length = len(phrase.encode('utf-8')) + 1
+        if used + length > size:
+            continue
+        chosen.append(phrase)
+        used += length
+        if used >= size - 4:
+            break
+
+    # 점수 낮은 구절부터 → 가장 유용한 구절이 사전 끝(가장 가까운 거리)에 옴
+    return ' '.join(reversed(chosen)).encode('utf-8')[-size:]
+
+
+def deflate_size(data, zdict=None):
+    """헤더 없는 raw deflate 크기 (사전 사용 시 zdict 지정)"""
+    compressor = (zlib.compressobj(9, zlib.DEFLATED, -15, zdict=zdict) if zdict
+                  else zlib.compressobj(9, zlib.DEFLATED, -15))
+    return len(compressor.compress(data) + compressor.flush())
+
+
+def measure(blobs, zdict):
+    """gzip / raw deflate / 사전 deflate 합계 바이트"""
+    totals = {'raw': 0, 'gzip': 0, 'deflate': 0, 'zdict': 0}
+    for data in blobs:
+        totals['raw'] += len(data)
+        totals['gzip'] += len(gzip.compress(data, compresslevel=9, mtime=0))
+        totals['deflate'] += deflate_size(data)
+        totals['zdict'] += deflate_size(data, zdict)
+    return totals
+
+
+def shard_blobs():
+    """build_fortune_shards와 같은 샤드 JSON 바이트"""
+    groups = list(horoscope_shards().values()) + list(fortune_shards().values())
+    return [json.dumps(shard_payload(rows), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            for rows in groups]
+
+
+def write_dictionary(zdict, output_dir, trained_on):
+    """해시 이름으로 사전 저장 + dictionary.json 갱신. 파일명 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    name = f"fortune-dict.{hashlib.sha256(zdict).hexdigest()[:10]}.bin"
+    path = os.path.join(output_dir, name)
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(zdict)
+        os.replace(tmp_path, path)
+
+    meta = {'file': name, 'bytes': len(zdict), 'format': 'raw', 'window_bits': 15, 'trained_on': trained_on}
+    tmp_path = os.path.join(output_dir, META_NAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=1)
+    os.replace(tmp_path, os.path.join(output_dir, META_NAME))
+
+    # 예전 사전 정리
+    for old in glob.glob(os.path.join(output_dir, 'fortune-dict.*.bin')):
+        if os.path.basename(old) != name:
+            os.remove(old)
+    return name
+
+
+def _report(label, totals):
+    print(f"{label:<22} 원본 {totals['raw'] / 1024:7.1f} KB  gzip {totals['gzip'] / 1024:6.1f} KB  "
+          f"deflate {totals['deflate'] / 1024:6.1f} KB  사전 {totals['zdict'] / 1024:6.1f} KB  "
+          f"(gzip 대비 {totals['zdict'] / totals['gzip']:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='운세 문구 공유 압축 사전 학습 및 압축률 비교')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='사전 출력 폴더')
+    parser.add_argument('--size', type=int, default=DEFAULT_DICT_SIZE, help='사전 최대 바이트 (최대 32768)')
+    parser.add_argument('--holdout', type=float, default=DEFAULT_HOLDOUT,
+                        help='학습에서 빼고 평가만 할 문구 비율')
+    parser.add_argument('--dry-run', action='store_true', help='사전 파일은 쓰지 않고 결과만 출력')
+    args = parser.parse_args()
+
+    if not 0 < args.size <= DEFAULT_DICT_SIZE:
+        parser.error(f'--size는 1~{DEFAULT_DICT_SIZE} 사이여야 합니다')
+
+    entries = corpus_entries()
+    train = [text for key, text in entries if not is_holdout(key, args.holdout)]
+    holdout = [text for key, text in entries if is_holdout(key, args.holdout)]
+    zdict = train_dictionary(train, args.size)
+
+    print(f"문구 {len(entries)}개 (학습 {len(train)} / 평가 {len(holdout)}), 사전 {len(zdict) / 1024:.1f} KB\n")
+    _report('문구 단위 (학습 포함)', measure([text.encode('utf-8') for _, text in entries], zdict))
+    if holdout:
+        _report('문구 단위 (평가용만)', measure([text.encode('utf-8') for text in holdout], zdict))
+    _report('샤드 단위', measure(shard_blobs(), zdict))
+
+    if not args.dry_run:
+        name = write_dictionary(zdict, args.output, ['horoscope.csv', 'fortune.csv', 'fortune_database.json'])
+        print(f"\n✅ {os.path.join(args.output, name)}")
+
+
+if __name__ == '__main__':
+    main()